@@ -1,50 +1,307 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import math
 import os
-from datetime import datetime, time as dt_time
+import threading
+from calendar import monthrange
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, time as dt_time, timedelta
+from functools import lru_cache
+from itertools import groupby
+from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
-from flask import Flask, jsonify, render_template, request, redirect, url_for, session
+from flask import Flask, g, jsonify, render_template, request, redirect, url_for, session
+
+try:
+    import orjson  # optional: much faster JSON parse/serialize
+except ImportError:
+    orjson = None
+
+try:
+    from reportlab import rl_config
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import (
+        Image, LongTable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    )
+except ImportError:  # PDF exports fail with a clear error instead
+    getSampleStyleSheet = None
+else:
+    # Store streams (notably the header logo) as binary instead of ASCII85 text:
+    # without the optional C accelerator ReportLab encodes ASCII85 in pure
+    # Python, which was most of the cost of every PDF export
+    rl_config.useA85 = 0
+    
+    # Report styles are plain configuration, so they are built once at import
+    _PDF_SAMPLE_STYLES = getSampleStyleSheet()
+    
+    _PDF_MONTHLY_TITLE_STYLE = ParagraphStyle(
+        'ReportTitle',
+        parent=_PDF_SAMPLE_STYLES['Heading2'],
+        fontSize=16,  # Smaller font to save space
+        spaceAfter=12,  # Restore proper spacing
+        alignment=1,  # Center alignment
+        fontName='Helvetica-Bold',
+        textColor=colors.black
+    )
+    _PDF_MONTHLY_SUBTITLE_STYLE = ParagraphStyle(
+        'MonthStyle',
+        parent=_PDF_SAMPLE_STYLES['Normal'],
+        fontSize=14,  # Smaller font to save space
+        spaceAfter=20,  # Restore proper spacing
+        alignment=1,  # Center alignment
+        textColor=colors.grey,  # Gray color for subtitle
+        fontName='Helvetica'
+    )
+    _PDF_DAILY_TITLE_STYLE = ParagraphStyle(
+        'ReportTitle',
+        parent=_PDF_SAMPLE_STYLES['Heading2'],
+        fontSize=14,
+        spaceAfter=12,
+        alignment=1  # Center alignment
+    )
+    _PDF_DAILY_DATE_STYLE = ParagraphStyle(
+        'DateStyle',
+        parent=_PDF_SAMPLE_STYLES['Heading3'],
+        fontSize=12,
+        spaceAfter=20,
+        alignment=1  # Center alignment
+    )
+    _PDF_DETAILED_TITLE_STYLE = ParagraphStyle(
+        'ReportTitle',
+        parent=_PDF_SAMPLE_STYLES['Heading2'],
+        fontSize=16,
+        spaceAfter=12,
+        alignment=1  # Center alignment
+    )
+    _PDF_FACULTY_HEADER_STYLE = ParagraphStyle(
+        'FacultyHeader',
+        parent=_PDF_SAMPLE_STYLES['Heading3'],
+        fontSize=14,
+        spaceAfter=10,
+        textColor=colors.blue,  # Blue color like Excel
+        fontName='Helvetica-Bold'
+    )
+    
+    # Monthly delay report table: black header row, alternating white/grey data rows
+    _MONTHLY_TABLE_STYLE = TableStyle([
+        # Header styling - black background with white text (applies to all header rows including repeated ones)
+        ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'LEFT'),  # Left align headers
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),  # Larger header font
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),  # Better padding
+        ('TOPPADDING', (0, 0), (-1, 0), 10),
+        # White vertical borders for header
+        ('LINEBEFORE', (0, 0), (0, 0), 1.0, colors.white),
+        ('LINEBEFORE', (1, 0), (1, 0), 1.0, colors.white),
+        ('LINEBEFORE', (2, 0), (2, 0), 1.0, colors.white),
+        ('LINEAFTER', (0, 0), (0, 0), 1.0, colors.white),
+        ('LINEAFTER', (1, 0), (1, 0), 1.0, colors.white),
+        ('LINEAFTER', (2, 0), (2, 0), 1.0, colors.white),
+        # Data row styling - alternating white and light grey
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),  # Left align data
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),  # Larger data font for better readability
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Better padding
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        # Black borders for all cells
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Clean borders
+    ])
+    
+    # Daily attendance table, matching the monthly report
+    _DAILY_TABLE_STYLE = TableStyle([
+        # Header styling - black background with white text (matching monthly report)
+        ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'LEFT'),  # Left align headers (matching monthly report)
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),  # Better padding
+        ('TOPPADDING', (0, 0), (-1, 0), 10),
+        # White vertical borders for header (matching monthly report)
+        ('LINEBEFORE', (0, 0), (0, 0), 1.0, colors.white),
+        ('LINEBEFORE', (1, 0), (1, 0), 1.0, colors.white),
+        ('LINEBEFORE', (2, 0), (2, 0), 1.0, colors.white),
+        ('LINEBEFORE', (3, 0), (3, 0), 1.0, colors.white),
+        ('LINEBEFORE', (4, 0), (4, 0), 1.0, colors.white),
+        ('LINEAFTER', (0, 0), (0, 0), 1.0, colors.white),
+        ('LINEAFTER', (1, 0), (1, 0), 1.0, colors.white),
+        ('LINEAFTER', (2, 0), (2, 0), 1.0, colors.white),
+        ('LINEAFTER', (3, 0), (3, 0), 1.0, colors.white),
+        ('LINEAFTER', (4, 0), (4, 0), 1.0, colors.white),
+        # Data row styling - alternating white and light grey (matching monthly report)
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),  # Left align data (matching monthly report)
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),  # Larger data font for better readability
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Better padding
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        # Black borders for all cells (matching monthly report)
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Clean borders
+    ])
+    
+    # Detailed faculty report table; the last two rows are the Total Delay / Absent Count rows
+    _DETAILED_TABLE_STYLE = TableStyle([
+        # Header styling with white borders (applies to all header rows including repeated ones)
+        ('BACKGROUND', (0, 0), (-1, 0), colors.black),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('TOPPADDING', (0, 0), (-1, 0), 12),
+        ('LEFTPADDING', (0, 0), (-1, 0), 8),
+        ('RIGHTPADDING', (0, 0), (-1, 0), 8),
+        # White borders for header columns
+        ('LINEBEFORE', (0, 0), (0, 0), 2, colors.white),
+        ('LINEAFTER', (0, 0), (0, 0), 2, colors.white),
+        ('LINEBEFORE', (1, 0), (1, 0), 2, colors.white),
+        ('LINEAFTER', (1, 0), (1, 0), 2, colors.white),
+        ('LINEBEFORE', (2, 0), (2, 0), 2, colors.white),
+        ('LINEAFTER', (2, 0), (2, 0), 2, colors.white),
+        ('LINEBEFORE', (3, 0), (3, 0), 2, colors.white),
+        ('LINEAFTER', (3, 0), (3, 0), 2, colors.white),
+        # Data row styling
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
+        ('TOPPADDING', (0, 1), (-1, -1), 10),
+        ('LEFTPADDING', (0, 1), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 1), (-1, -1), 8),
+        # Column alignment - Date left, Times and Delay center
+        ('ALIGN', (0, 1), (0, -1), 'LEFT'),   # Date column - left aligned
+        ('ALIGN', (1, 1), (2, -1), 'CENTER'), # Time columns - center aligned
+        ('ALIGN', (3, 1), (3, -1), 'CENTER'), # Delay column - center aligned
+        # Borders
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+        # Total row styling - center aligned
+        ('BACKGROUND', (0, -2), (-1, -2), colors.lightblue),  # Total Delay row
+        ('FONTNAME', (0, -2), (-1, -2), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, -2), (-1, -2), 11),
+        ('ALIGN', (0, -2), (-1, -2), 'CENTER'),
+        # Absent count row styling - light red background
+        ('BACKGROUND', (0, -1), (-1, -1), colors.lightcoral),  # Absent Count row
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, -1), (-1, -1), 11),
+        ('ALIGN', (0, -1), (-1, -1), 'CENTER'),
+    ])
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+except ImportError:  # Excel exports fail with a clear error instead
+    Workbook = None
+else:
+    # Shared Excel style objects; openpyxl copies them into each workbook,
+    # so one instance per process is enough
+    _XL_THIN = Side(style='thin', color='000000')
+    _XL_MEDIUM = Side(style='medium', color='000000')
+    _XL_MEDIUM_WHITE = Side(style='medium', color='FFFFFF')
+    _XL_BORDER_THIN = Border(left=_XL_THIN, right=_XL_THIN, top=_XL_THIN, bottom=_XL_THIN)
+    _XL_BORDER_MEDIUM = Border(left=_XL_MEDIUM, right=_XL_MEDIUM, top=_XL_MEDIUM, bottom=_XL_MEDIUM)
+    # White side borders for better column identification
+    _XL_BORDER_HEADER = Border(left=_XL_MEDIUM_WHITE, right=_XL_MEDIUM_WHITE, top=_XL_MEDIUM, bottom=_XL_MEDIUM)
+    _XL_CENTER = Alignment(horizontal="center", vertical="center")
+    _XL_LEFT = Alignment(horizontal="left", vertical="center")
+    _XL_FONT = Font(size=11)
+    _XL_FONT_BOLD = Font(bold=True, size=11)
+    _XL_FONT_BOLD_12 = Font(bold=True, size=12)
+    _XL_FONT_HEADER = Font(bold=True, color="FFFFFF", size=12)  # White text
+    _XL_FONT_TITLE = Font(bold=True, size=16)
+    _XL_FONT_HEADING = Font(bold=True, size=16, color="000000")
+    _XL_FONT_FACULTY = Font(bold=True, size=14, color="0000FF")  # Blue text
+    _XL_FONT_ABSENT = Font(color="FF0000", bold=True)  # Red text
+
+
+@lru_cache(maxsize=32)
+def _xl_fill(color: str):
+    """Solid PatternFill for a hex color, shared across exports."""
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+def new_xl_workbook():
+    """Empty write-only openpyxl workbook for the Excel exports."""
+    if Workbook is None:
+        raise RuntimeError("openpyxl is required for Excel export")
+    return Workbook(write_only=True)
 
 
 app = Flask(__name__)
 
 
+def get_pdf_styles():
+    """ReportLab sample stylesheet, built once per process."""
+    if getSampleStyleSheet is None:
+        raise RuntimeError("reportlab is required for PDF export")
+    return _PDF_SAMPLE_STYLES
+
+
+LOGO_PATH = Path(__file__).parent / "static" / "images" / "logo-removebg-preview.png"
+
+_pdf_header_parts: Dict[str, Any] | None = None
+
+def _get_pdf_header_parts() -> Dict[str, Any]:
+    """Styles, logo bytes and table style for the PDF header, built once per process."""
+    global _pdf_header_parts
+    if _pdf_header_parts is not None:
+        return _pdf_header_parts
+    styles = get_pdf_styles()
+    try:
+        logo_bytes = LOGO_PATH.read_bytes() if LOGO_PATH.exists() else None
+    except OSError:
+        logo_bytes = None
+    _pdf_header_parts = {
+        'title_style': ParagraphStyle(
+            'HeaderTitle', 
+            parent=styles['Title'], 
+            alignment=0, 
+            fontSize=16, 
+            leading=19
+        ),
+        'sub_style': ParagraphStyle(
+            'HeaderSub', 
+            parent=styles['Normal'], 
+            alignment=0, 
+            fontSize=10, 
+            leading=12
+        ),
+        'logo_bytes': logo_bytes,
+        'table_style': TableStyle([
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('LINEBELOW', (0,0), (-1,0), 0.75, colors.lightgrey),
+            ('LEFTPADDING', (0,0), (-1,-1), 0),
+            ('RIGHTPADDING', (0,0), (-1,-1), 0),
+            ('TOPPADDING', (0,0), (-1,-1), 0),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+        ]),
+    }
+    return _pdf_header_parts
+
+
 def create_pdf_header():
     """PDF Header Design Code"""
+    parts = _get_pdf_header_parts()
     
-    # Get styles
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    styles = getSampleStyleSheet()
-    
-    # Define header styles
-    header_title = ParagraphStyle(
-        'HeaderTitle', 
-        parent=styles['Title'], 
-        alignment=0, 
-        fontSize=16, 
-        leading=19
-    )
-    header_sub = ParagraphStyle(
-        'HeaderSub', 
-        parent=styles['Normal'], 
-        alignment=0, 
-        fontSize=10, 
-        leading=12
-    )
-    
-    # Logo setup
+    # Logo setup (a fresh flowable per document, decoded from cached bytes)
     try:
-        from flask import current_app
-        from pathlib import Path
-        logo_path = Path(__file__).parent / "static" / "images" / "logo-removebg-preview.png"
-        if logo_path.exists():
-            from reportlab.platypus import Image
-            from reportlab.lib.units import mm
-            logo_img = Image(str(logo_path))
+        if parts['logo_bytes']:
+            logo_img = Image(BytesIO(parts['logo_bytes']))
             logo_img._restrictSize(26*mm, 26*mm)
         else:
             logo_img = ''
@@ -52,32 +309,17 @@ def create_pdf_header():
         logo_img = ''
     
     # Header text
-    from reportlab.platypus import Paragraph
     header_text = [
-        Paragraph('Dr. B. B. Hegde First Grade College, Kundapura', header_title),
-        Paragraph('A Unit of Coondapur Education Society (R)', header_sub)
+        Paragraph('Dr. B. B. Hegde First Grade College, Kundapura', parts['title_style']),
+        Paragraph('A Unit of Coondapur Education Society (R)', parts['sub_style'])
     ]
     
     # Create header table
-    from reportlab.platypus import Table, TableStyle
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import mm
-    from reportlab.lib import colors
-    
     header_table = Table(
         [[logo_img, header_text]], 
         colWidths=[26*mm, (A4[0] - (18*mm + 18*mm) - 26*mm)]
     )
-    
-    # Header table styling
-    header_table.setStyle(TableStyle([
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('LINEBELOW', (0,0), (-1,0), 0.75, colors.lightgrey),
-        ('LEFTPADDING', (0,0), (-1,-1), 0),
-        ('RIGHTPADDING', (0,0), (-1,-1), 0),
-        ('TOPPADDING', (0,0), (-1,-1), 0),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-    ]))
+    header_table.setStyle(parts['table_style'])
     
     return header_table
 # Simple secret key for session management; replace via ENV in production
@@ -89,10 +331,114 @@ ATTENDANCE_DIR = os.environ.get("ATTENDANCE_DIR", r"F:\\Graahi Reports_new\\Graa
 
 
 def get_attendance_dir() -> Path:
-    # Allow overriding via query parameter for flexibility (read-only)
-    override = request.args.get("dir")
-    path_str = override if override else ATTENDANCE_DIR
-    return Path(path_str)
+    # Allow overriding via query parameter for flexibility (read-only);
+    # resolved once per request and kept on flask.g
+    if "attendance_dir" not in g:
+        override = request.args.get("dir")
+        path_str = override if override else ATTENDANCE_DIR
+        g.attendance_dir = Path(path_str)
+    return g.attendance_dir
+
+
+# Attendance files are read/written in one shot through a 64KB buffer
+IO_BUFFER_SIZE = 64 * 1024
+
+# Parsed attendance files keyed by path; entries are valid while (mtime_ns, size) match
+JSON_CACHE_SIZE = 128  # a few months of day files
+_json_cache: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
+
+# What _load_json can raise for a missing/unreadable/malformed file; both
+# json.JSONDecodeError and orjson.JSONDecodeError (and UnicodeDecodeError) are ValueErrors
+JSON_READ_ERRORS = (OSError, ValueError)
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    with path.open("rb", buffering=IO_BUFFER_SIZE) as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dump_json(path: Path, data: Any) -> None:
+    """Write `data` as indented UTF-8 JSON, using orjson when it is installed.
+
+    The file is written to a temp sibling and swapped in with os.replace, so
+    concurrent readers never see a partially written file.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb", buffering=IO_BUFFER_SIZE) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    with _json_cache_lock:
+        _json_cache.pop(str(path), None)
+
+
+def _load_json_cached(path: Path, copy: bool = True) -> Any:
+    """Like _load_json, but reuses the parsed result while the file is unchanged.
+    Callers get their own copy of each record, so mutating the result is safe;
+    read-only callers can pass copy=False to iterate the shared records as-is.
+    """
+    st = path.stat()
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _json_cache_lock:
+        hit = _json_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _json_cache.move_to_end(key)
+            data = hit[1]
+        else:
+            data = None
+    if data is None:
+        data = _load_json(path)
+        with _json_cache_lock:
+            _json_cache[key] = (stamp, data)
+            while len(_json_cache) > JSON_CACHE_SIZE:
+                _json_cache.popitem(last=False)
+    if copy and isinstance(data, list):
+        return [dict(r) if isinstance(r, dict) else r for r in data]
+    return data
+
+
+class DayFile:
+    """Read-modify-write access to one YYYY-MM-DD.json attendance file.
+
+    The file is loaded once on enter and written back once, atomically, on
+    exit - only if save() was called and the block did not raise - so
+    several edits to the same day share a single write:
+
+        with DayFile(path) as day:
+            day.records.append(...)
+            day.save()
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.records: Any = []
+        self._dirty = False
+
+    def __enter__(self) -> "DayFile":
+        if self.path.exists():
+            self.records = _load_json_cached(self.path)
+        return self
+
+    def save(self) -> None:
+        self._dirty = True
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self._dirty:
+            _dump_json(self.path, self.records)
 
 
 def read_attendance_for_date(base_dir: Path, date_str: str) -> List[Dict[str, Any]]:
@@ -106,14 +452,13 @@ def read_attendance_for_date(base_dir: Path, date_str: str) -> List[Dict[str, An
     if not file_path.exists():
         return []
     try:
-        with file_path.open("r", encoding="utf-8") as f:  # read-only
-            data = json.load(f)
-            # Ensure we return a list of dicts
-            if isinstance(data, list):
-                return data
-            return []
-    except Exception:
-        # Fail closed on parse errors
+        data = _load_json_cached(file_path)
+        # Ensure we return a list of dicts
+        if isinstance(data, list):
+            return data
+        return []
+    except JSON_READ_ERRORS:
+        # Fail closed on I/O and parse errors
         return []
 
 
@@ -121,6 +466,19 @@ def is_logged_in() -> bool:
     return bool(session.get("logged_in"))
 
 
+def _json_response(payload: Any, status: int = 200):
+    """JSON response like jsonify (sorted keys), serialized with orjson when installed."""
+    if orjson is None:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    return app.response_class(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
 
 
 def get_attendance_from_source(date_str: str) -> List[Dict[str, Any]]:
@@ -131,12 +489,11 @@ def get_attendance_from_source(date_str: str) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with source_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-            return []
-    except Exception:
+        data = _load_json_cached(source_file)
+        if isinstance(data, list):
+            return data
+        return []
+    except JSON_READ_ERRORS:
         return []
 
 
@@ -144,21 +501,46 @@ def get_attendance_from_source(date_str: str) -> List[Dict[str, Any]]:
 FACULTY_DETAIL_PATH = Path.cwd() / "JSON" / "faculty_detail.json"
 
 _faculty_cache: Dict[str, Dict[str, Any]] | None = None
+_faculty_cache_stamp: Tuple[int, int] | None = None
+_faculty_cache_lock = threading.Lock()
+# ID -> (faculty details the entry was classified from, staff type)
+_staff_type_cache: Dict[str, Tuple[Dict[str, Dict[str, Any]], str]] = {}
+
+def _faculty_file_stamp() -> Tuple[int, int] | None:
+    try:
+        st = FACULTY_DETAIL_PATH.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 def load_faculty_details() -> Dict[str, Dict[str, Any]]:
-    global _faculty_cache
-    if _faculty_cache is not None:
+    """Faculty details keyed by ID; reloaded only when faculty_detail.json changes.
+    Safe to call from the annotation worker threads: one thread reloads, the rest reuse it.
+    """
+    global _faculty_cache, _faculty_cache_stamp
+    stamp = _faculty_file_stamp()
+    cached = _faculty_cache
+    if cached is not None and stamp == _faculty_cache_stamp:
+        return cached
+    with _faculty_cache_lock:
+        # Another thread may have reloaded it while this one waited
+        if _faculty_cache is not None and stamp == _faculty_cache_stamp:
+            return _faculty_cache
+        invalidate_faculty_cache()
+        try:
+            data = _load_json(FACULTY_DETAIL_PATH)
+        except JSON_READ_ERRORS:
+            data = None
+        _faculty_cache = data if isinstance(data, dict) else {}
+        # Stamp last: a reader that sees this stamp also sees the new details
+        _faculty_cache_stamp = stamp
         return _faculty_cache
-    try:
-        with FACULTY_DETAIL_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, dict):
-                _faculty_cache = data
-                return data
-    except Exception:
-        pass
-    _faculty_cache = {}
-    return _faculty_cache
+
+def invalidate_faculty_cache() -> None:
+    """Drop cached faculty details and everything derived from them."""
+    global _faculty_cache
+    _faculty_cache = None
+    _staff_type_cache.clear()
 
 def determine_staff_type(faculty_id: str) -> str:
     """Return 'teaching', 'admin', or 'support' using faculty_detail.json.
@@ -168,7 +550,23 @@ def determine_staff_type(faculty_id: str) -> str:
     - department includes 'Support' => support
     Defaults to teaching if unknown.
     """
-    details = load_faculty_details().get((faculty_id or '').strip().upper()) or {}
+    # Goes through load_faculty_details() first so a changed faculty_detail.json
+    # is picked up. Entries carry the details dict they were classified from and
+    # only count for that same dict, so one written late by a thread still holding
+    # the previous details can never be served after a reload.
+    details = load_faculty_details()
+    # Cached under the ID as given as well, so repeat calls skip the strip/upper
+    cached = _staff_type_cache.get(faculty_id)
+    if cached is None or cached[0] is not details:
+        key = (faculty_id or '').strip().upper()
+        cached = _staff_type_cache.get(key)
+        if cached is None or cached[0] is not details:
+            cached = _staff_type_cache[key] = (details, _classify_staff(details.get(key) or {}))
+        if faculty_id:
+            _staff_type_cache[faculty_id] = cached
+    return cached[1]
+
+def _classify_staff(details: Dict[str, Any]) -> str:
     category = (details.get('category') or '').strip().lower()
     department = (details.get('department') or '').strip().lower()
     if category == 'teaching faculty':
@@ -185,19 +583,32 @@ def determine_staff_type(faculty_id: str) -> str:
     # fallback
     return 'teaching'
 
+# (check-in deadline, required check-out) per staff type, for weekdays and Saturdays
+_THRESHOLDS: Dict[Tuple[str, bool], Tuple[dt_time, dt_time]] = {
+    ('teaching', False): (dt_time(9, 25), dt_time(16, 30)),
+    ('teaching', True): (dt_time(9, 25), dt_time(13, 0)),
+    ('admin', False): (dt_time(9, 15), dt_time(17, 15)),
+    ('admin', True): (dt_time(9, 15), dt_time(13, 30)),
+    ('support', False): (dt_time(8, 30), dt_time(17, 15)),
+    ('support', True): (dt_time(8, 30), dt_time(13, 30)),
+}
+
 def get_thresholds_for(date_obj: datetime, staff_type: str) -> Tuple[dt_time, dt_time]:
-    weekday = date_obj.weekday()  # 0=Mon ... 5=Sat ... 6=Sun
-    is_saturday = (weekday == 5)
-    if staff_type == 'teaching':
-        checkin_deadline = dt_time(9, 25)
-        checkout_after = dt_time(13, 0) if is_saturday else dt_time(16, 30)
-    elif staff_type == 'admin':
-        checkin_deadline = dt_time(9, 15)
-        checkout_after = dt_time(13, 30) if is_saturday else dt_time(17, 15)
-    else:  # support
-        checkin_deadline = dt_time(8, 30)
-        checkout_after = dt_time(13, 30) if is_saturday else dt_time(17, 15)
-    return checkin_deadline, checkout_after
+    is_saturday = date_obj.weekday() == 5  # 0=Mon ... 5=Sat ... 6=Sun
+    if staff_type not in ('teaching', 'admin'):
+        staff_type = 'support'
+    return _THRESHOLDS[staff_type, is_saturday]
+
+STAFF_TYPES = ('teaching', 'admin', 'support')
+
+@lru_cache(maxsize=512)
+def get_threshold_datetimes(date_obj: datetime, staff_type: str) -> Tuple[datetime, datetime]:
+    """Check-in deadline and required check-out as full datetimes on date_obj's day.
+    Memoized: the report loops ask for the same (day, staff type) pairs for every faculty.
+    """
+    checkin_deadline, checkout_after = get_thresholds_for(date_obj, staff_type)
+    day = date_obj.date()
+    return datetime.combine(day, checkin_deadline), datetime.combine(day, checkout_after)
 
 def parse_ts(value: Any) -> datetime | None:
     if not value:
@@ -208,104 +619,250 @@ def parse_ts(value: Any) -> datetime | None:
         except Exception:
             return None
     if isinstance(value, str):
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                return datetime.strptime(value, fmt)
-            except Exception:
-                continue
+        return _parse_ts_str(value)
+    return None
+
+@lru_cache(maxsize=8192)
+def _parse_ts_str(value: str) -> datetime | None:
+    # Same timestamps are parsed repeatedly (delay calc, formatting, update lookups),
+    # so string inputs are memoized; datetime objects are immutable and safe to share.
+    # Fast path: records written by this app are plain ISO 8601 (naive, optional 'Z').
+    try:
+        return datetime.fromisoformat(value[:-1] if value.endswith('Z') else value)
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
         try:
-            return datetime.fromisoformat(value)
+            return datetime.strptime(value, fmt)
         except Exception:
-            return None
-    return None
+            continue
+    try:
+        return datetime.fromisoformat(value)
+    except Exception:
+        return None
 
+@lru_cache(maxsize=4096)
 def _seconds_to_hhmmss(total_seconds: int) -> str:
+    # Daily delays cluster around a few values (mostly 0), so results are memoized
     if total_seconds < 0:
         total_seconds = 0
-    hours = total_seconds // 3600
-    minutes_only = (total_seconds % 3600) // 60
-    seconds_only = total_seconds % 60
+    hours, rem = divmod(total_seconds, 3600)
+    minutes_only, seconds_only = divmod(rem, 60)
     return f"{hours:02d}:{minutes_only:02d}:{seconds_only:02d}"
 
+def _round_seconds(td: timedelta) -> int:
+    """Integer equivalent of round(td.total_seconds()) (half to even)."""
+    seconds = td.days * 86400 + td.seconds
+    us = td.microseconds
+    if us > 500000 or (us == 500000 and seconds % 2):
+        seconds += 1
+    return seconds
+
+def _ceil_seconds(td: timedelta) -> int:
+    """Integer equivalent of math.ceil(td.total_seconds())."""
+    return td.days * 86400 + td.seconds + (1 if td.microseconds else 0)
+
+def _ts_to_hhmmss(value: Any, default: str = 'Not recorded') -> str:
+    """Return the HH:MM:SS part of a stored timestamp, or `default`.
+    ISO strings are sliced directly; anything else goes through parse_ts.
+    """
+    if (isinstance(value, str) and len(value) >= 19 and value[4] == '-' and value[7] == '-'
+            and value[10] in 'T ' and value[13] == ':' and value[16] == ':'):
+        return value[11:19]
+    dt = parse_ts(value)
+    return dt.strftime('%H:%M:%S') if dt else default
+
+
+def _record_sort_key(record: Dict[str, Any]) -> Tuple[str, str]:
+    """Day-file order: faculty ID (already normalized by the caller), then check-in.
+    A missing check-in sorts first without being written back to the record.
+    """
+    return record['student_id'], record.get('checkin') or ''
+
+
+def _iso_order_key(value: Any) -> str | None:
+    """String that sorts chronologically for a plain ISO timestamp
+    (YYYY-MM-DD[T ]HH:MM:SS[.ffffff], no zone); None for anything else.
+    """
+    if (isinstance(value, str) and len(value) >= 19 and value[10] in 'T ' and value[4] == '-'
+            and value[7] == '-' and value[13] == ':' and value[16] == ':'
+            and (len(value) == 19 or (value[19] == '.' and value[20:].isdigit()))):
+        return value[:10] + value[11:]  # drop the separator: 'T' and ' ' may be mixed
+    return None
 
-def compute_daily_delay_for_records(records: List[Dict[str, Any]], date_obj: datetime, staff_type: str) -> str:
-    """Compute total delay as HH:MM:SS for a day's records for a single faculty.
-    Uses earliest check-in and latest check-out. If no checkout present in any record, returns 'N/A'.
+def checkin_checkout_bounds(records: List[Dict[str, Any]]) -> Tuple[datetime | None, datetime | None]:
+    """Earliest check-in and latest check-out across records (None when there is none).
+    Plain ISO timestamps are compared as strings and only the two winners are
+    parsed; any other value makes the whole set go through parse_ts.
     """
-    checkins: List[datetime] = []
-    checkouts: List[datetime] = []
+    first_in = last_out = None
+    first_key = last_key = None
     for r in records:
-        ci = parse_ts(r.get('checkin'))
-        co = parse_ts(r.get('checkout'))
+        ci = r.get('checkin')
         if ci:
-            checkins.append(ci)
+            key = _iso_order_key(ci)
+            if key is None:
+                break
+            if first_key is None or key < first_key:
+                first_key, first_in = key, ci
+        co = r.get('checkout')
         if co:
-            checkouts.append(co)
-    if not checkins:
-        return _seconds_to_hhmmss(0)  # no checkin → treat as 0 delay
-    earliest_in = min(checkins)
-    checkin_deadline, checkout_after = get_thresholds_for(date_obj, staff_type)
+            key = _iso_order_key(co)
+            if key is None:
+                break
+            if last_key is None or key > last_key:
+                last_key, last_out = key, co
+    else:
+        # Every value was plain ISO: parse just the winners (unless one is not a real date)
+        earliest_in = parse_ts(first_in)
+        latest_out = parse_ts(last_out)
+        if (earliest_in is None) == (first_in is None) and (latest_out is None) == (last_out is None):
+            return earliest_in, latest_out
+    
+    checkins = [dt for dt in (parse_ts(r.get('checkin')) for r in records) if dt]
+    checkouts = [dt for dt in (parse_ts(r.get('checkout')) for r in records) if dt]
+    return (min(checkins) if checkins else None), (max(checkouts) if checkouts else None)
+
+def compute_daily_delay_seconds(records: List[Dict[str, Any]], date_obj: datetime, staff_type: str,
+                                thresholds: Tuple[datetime, datetime] | None = None) -> int:
+    """Total delay in whole seconds for a day's records for a single faculty.
+    Uses earliest check-in and latest check-out; without a checkout only the check-in delay counts.
+    `thresholds` may carry precomputed get_threshold_datetimes(date_obj, staff_type).
+    """
+    earliest_in, latest_out = checkin_checkout_bounds(records)
+    return delay_seconds_for_bounds(earliest_in, latest_out, date_obj, staff_type, thresholds)
+
+def delay_seconds_for_bounds(earliest_in: datetime | None, latest_out: datetime | None, date_obj: datetime,
+                             staff_type: str, thresholds: Tuple[datetime, datetime] | None = None) -> int:
+    """compute_daily_delay_seconds for an already known earliest check-in / latest check-out."""
+    if not earliest_in:
+        return 0  # no checkin → treat as 0 delay
+    if thresholds is None:
+        thresholds = get_threshold_datetimes(date_obj, staff_type)
+    deadline_dt, required_dt = thresholds
     late_seconds = 0
-    if earliest_in:
-        deadline_dt = datetime.combine(earliest_in.date(), checkin_deadline)
-        if earliest_in > deadline_dt:
-            late_seconds = round((earliest_in - deadline_dt).total_seconds())
-    if not checkouts:
+    # Thresholds apply on the day of the timestamp itself
+    if earliest_in.date() != deadline_dt.date():
+        deadline_dt = datetime.combine(earliest_in.date(), deadline_dt.time())
+    if earliest_in > deadline_dt:
+        late_seconds = _round_seconds(earliest_in - deadline_dt)
+    if not latest_out:
         # If no checkouts, return only check-in delay (not 'N/A')
-        return _seconds_to_hhmmss(late_seconds)
-    latest_out = max(checkouts)
-    required_dt = datetime.combine(latest_out.date(), checkout_after)
+        return late_seconds
+    if latest_out.date() != required_dt.date():
+        required_dt = datetime.combine(latest_out.date(), required_dt.time())
     early_leave_seconds = 0
     if latest_out < required_dt:
-        early_leave_seconds = int(math.ceil((required_dt - latest_out).total_seconds()))
-    return _seconds_to_hhmmss(late_seconds + early_leave_seconds)
+        early_leave_seconds = _ceil_seconds(required_dt - latest_out)
+    return late_seconds + early_leave_seconds
+
+def compute_daily_delay_for_records(records: List[Dict[str, Any]], date_obj: datetime, staff_type: str,
+                                    thresholds: Tuple[datetime, datetime] | None = None) -> str:
+    """Compute total delay as HH:MM:SS for a day's records for a single faculty."""
+    return _seconds_to_hhmmss(compute_daily_delay_seconds(records, date_obj, staff_type, thresholds))
+
+# Files this process has annotated: path -> ((mtime_ns, size) after our write,
+# faculty_detail.json stamp the delays were computed with)
+_annotated_stamps: Dict[str, Tuple[Tuple[int, int], Tuple[int, int] | None]] = {}
+
+def _is_annotated(json_file: Path, st: os.stat_result, faculty_stamp: Tuple[int, int] | None) -> bool:
+    """True when this process already annotated the file as it is now, with the same faculty data."""
+    return _annotated_stamps.get(str(json_file)) == ((st.st_mtime_ns, st.st_size), faculty_stamp)
+
+def _mark_annotated(json_file: Path, st: os.stat_result, faculty_stamp: Tuple[int, int] | None) -> None:
+    _annotated_stamps[str(json_file)] = ((st.st_mtime_ns, st.st_size), faculty_stamp)
 
-def annotate_file_with_delay(json_file: Path) -> None:
-    """Read a date file, compute delay per faculty for that date, assign same delay to all their records."""
+def annotate_file_with_delay(json_file: Path, st: os.stat_result | None = None) -> None:
+    """Read a date file, compute delay per faculty for that date, assign same delay to all their records.
+    Skipped when the file and the faculty data are unchanged since this process last annotated it.
+    `st` may carry the file's stat result when the caller already has it (e.g. from os.scandir).
+    """
+    basename = json_file.stem  # YYYY-MM-DD; anything else is not a day file
+    if len(basename) != 10 or basename[4] != '-' or basename[7] != '-':
+        return
     try:
-        basename = json_file.stem  # YYYY-MM-DD
-        date_obj = datetime.strptime(basename, "%Y-%m-%d")
-    except Exception:
+        date_obj = datetime(int(basename[:4]), int(basename[5:7]), int(basename[8:]))
+    except ValueError:
+        return
+    if st is None:
+        try:
+            st = json_file.stat()
+        except OSError:
+            return
+    faculty_stamp = _faculty_file_stamp()
+    if _is_annotated(json_file, st, faculty_stamp):
         return
     try:
-        with json_file.open('r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_cached(json_file)
         if not isinstance(data, list):
             return
-        # normalize possible 'timestamp' only schema → treat as checkin-only
+        # One pass: normalize a possible 'timestamp'-only schema (→ checkin-only)
+        # and group by student_id, storing the canonical (stripped, upper-case) ID back
+        # (`changed` tracks whether any of this actually alters the file)
+        by_id: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        changed = False
         for row in data:
             if 'checkin' not in row and isinstance(row.get('timestamp'), str):
-                row['checkin'] = row.get('timestamp')
+                row['checkin'] = row['timestamp']
+                changed = True
             if 'checkout' not in row:
-                row['checkout'] = row.get('checkout', '')
-        # group by student_id
-        by_id: Dict[str, List[Dict[str, Any]]] = {}
-        for row in data:
+                row['checkout'] = ''
+                changed = True
             sid = (row.get('student_id') or '').strip().upper()
-            by_id.setdefault(sid, []).append(row)
-        # compute and annotate
+            if row.get('student_id') != sid:
+                row['student_id'] = sid
+                changed = True
+            by_id[sid].append(row)
+        # compute and annotate; thresholds only depend on the day and staff type
+        thresholds = {staff: get_threshold_datetimes(date_obj, staff) for staff in STAFF_TYPES}
         for sid, rows in by_id.items():
             staff_type = determine_staff_type(sid)
-            delay_val = compute_daily_delay_for_records(rows, date_obj, staff_type)
+            delay_val = compute_daily_delay_for_records(rows, date_obj, staff_type, thresholds[staff_type])
             for r in rows:
-                r['delay'] = delay_val
-        with json_file.open('w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+                if r.get('delay') != delay_val:
+                    r['delay'] = delay_val
+                    changed = True
+        # Rewrite (atomically) only when something changed; an untouched file
+        # keeps its mtime, so the read caches and report caches stay valid
+        if changed:
+            _dump_json(json_file, data)
+            st = json_file.stat()
+        _mark_annotated(json_file, st, faculty_stamp)
     except Exception:
         # ignore annotation errors
         pass
 
+ANNOTATE_WORKERS = min(8, os.cpu_count() or 4)
+
 def annotate_all_existing_files() -> Dict[str, Any]:
     """Annotate all JSON files currently present in source directory."""
     results = {"annotated": [], "errors": []}
     try:
         source_dir = get_attendance_dir()
-        for jf in source_dir.glob('*.json'):
-            try:
-                annotate_file_with_delay(jf)
+        # One directory scan; DirEntry.stat() comes from the listing itself on Windows
+        with os.scandir(source_dir) as it:
+            entries = [(source_dir / e.name, e.stat()) for e in it
+                       if e.name.endswith('.json') and e.is_file()]
+        # Files unchanged since we last annotated them (same stamp, same faculty data)
+        # are already up to date: report them without handing them to the pool
+        faculty_stamp = _faculty_file_stamp()
+        pending = []
+        for jf, st in entries:
+            if _is_annotated(jf, st, faculty_stamp):
                 results["annotated"].append(jf.name)
-            except Exception as e:
-                results["errors"].append({"file": jf.name, "error": str(e)})
+            else:
+                pending.append((jf, st))
+        entries = pending
+        # Files are independent read/compute/write jobs, so annotate them concurrently
+        with ThreadPoolExecutor(max_workers=ANNOTATE_WORKERS) as executor:
+            futures = {executor.submit(annotate_file_with_delay, jf, st): jf for jf, st in entries}
+            for future in as_completed(futures):
+                jf = futures[future]
+                try:
+                    future.result()
+                    results["annotated"].append(jf.name)
+                except Exception as e:
+                    results["errors"].append({"file": jf.name, "error": str(e)})
     except Exception as e:
         results["errors"].append({"file": "*", "error": str(e)})
     return results
@@ -339,56 +896,81 @@ def index():
     return render_template("index.html")
 
 
+def _attendance_etag(date_str: str) -> str:
+    """ETag for /api/attendance: everything the response is built from - the
+    source directory, the day file and faculty_detail.json stamps, and the delay
+    rules (AGGREGATE_RULES) - hashed into one opaque tag.
+    """
+    source_dir = get_attendance_dir()
+    try:
+        st = (source_dir / f"{date_str}.json").stat()
+        day_stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        day_stamp = None
+    parts = (AGGREGATE_RULES, str(source_dir), date_str, day_stamp, _faculty_file_stamp())
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
 @app.route("/api/attendance")
 def api_attendance():
     if not is_logged_in():
-        return jsonify({"error": "Not authenticated"}), 401
+        return _json_response({"error": "Not authenticated"}, 401)
     # Use current date by default
     date_str = request.args.get("date")
     if not date_str:
         date_str = datetime.now().strftime("%Y-%m-%d")
 
+    # Unchanged files since the client's last poll: answer 304 with no body.
+    # The files are stamped before they are read below, so the body is never
+    # older than the ETag it is sent with (at worst newer, costing one extra 200)
+    etag = _attendance_etag(date_str)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    # Load faculty details up front: this reloads a changed faculty_detail.json
+    # (clearing cached staff types) before any delay is computed
+    faculty_details = load_faculty_details()
+
     # Get data directly from source directory
     rows = get_attendance_from_source(date_str)
+
+    # Normalize faculty IDs and group records by them in one pass;
+    # later steps read row['student_id'] directly
+    by_id = defaultdict(list)
+    for row in rows:
+        sid = row['student_id'] = (row.get('student_id') or '').strip().upper()
+        by_id[sid].append(row)
+    existing_faculty_ids = by_id.keys()
     
     # Calculate delays for all records
     if rows:
         try:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            # Group records by faculty ID
-            by_id = {}
-            for row in rows:
-                sid = (row.get('student_id') or '').strip().upper()
-                if sid:
-                    by_id.setdefault(sid, []).append(row)
-            
             # Calculate delay for each faculty member
+            thresholds = {st: get_threshold_datetimes(date_obj, st) for st in STAFF_TYPES}
             for sid, faculty_rows in by_id.items():
+                if not sid:
+                    continue
                 staff_type = determine_staff_type(sid)
-                delay_val = compute_daily_delay_for_records(faculty_rows, date_obj, staff_type)
+                delay_val = compute_daily_delay_for_records(faculty_rows, date_obj, staff_type, thresholds[staff_type])
                 for r in faculty_rows:
                     r['delay'] = delay_val
         except Exception as e:
             print(f"Error calculating delays: {e}")
 
-    # Get all faculty members from faculty_detail.json
-    faculty_details = load_faculty_details()
-    
     # Create a comprehensive list with all faculty members
     all_faculty_records = []
     
-    # First, add existing attendance records with normalized case
-    for row in rows:
-        # Normalize student_id to uppercase for consistency
-        if 'student_id' in row:
-            row['student_id'] = row['student_id'].upper()
-        all_faculty_records.append(row)
+    # First, add existing attendance records (IDs already normalized above)
+    all_faculty_records.extend(rows)
     
     # Then, add faculty members who don't have attendance records
-    existing_faculty_ids = {row.get('student_id', '').strip().upper() for row in rows}
-    
     for faculty_id, faculty_info in faculty_details.items():
-        if faculty_id.upper() not in existing_faculty_ids:
+        faculty_id = faculty_id.upper()
+        if faculty_id not in existing_faculty_ids:
             # Create a record for faculty with no attendance data
             record = {
                 'student_id': faculty_id,
@@ -401,33 +983,9 @@ def api_attendance():
     
     # Apply refined delay display logic (same as PDF)
     for record in all_faculty_records:
-        # Format check-in time
-        checkin = record.get('checkin', '')
-        if checkin and checkin != '':
-            try:
-                dt = parse_ts(checkin)
-                if dt:
-                    checkin_formatted = dt.strftime('%H:%M:%S')
-                else:
-                    checkin_formatted = 'Not recorded'
-            except:
-                checkin_formatted = 'Not recorded'
-        else:
-            checkin_formatted = 'Not recorded'
-        
-        # Format check-out time
-        checkout = record.get('checkout', '')
-        if checkout and checkout != '':
-            try:
-                dt = parse_ts(checkout)
-                if dt:
-                    checkout_formatted = dt.strftime('%H:%M:%S')
-                else:
-                    checkout_formatted = 'Not recorded'
-            except:
-                checkout_formatted = 'Not recorded'
-        else:
-            checkout_formatted = 'Not recorded'
+        # Format check-in / check-out time
+        checkin_formatted = _ts_to_hhmmss(record.get('checkin', ''))
+        checkout_formatted = _ts_to_hhmmss(record.get('checkout', ''))
         
         # Apply refined delay display logic
         delay = record.get('delay', '')
@@ -445,9 +1003,12 @@ def api_attendance():
             record['delay'] = '00:00:00'
     
     # Sort by faculty ID
-    all_faculty_records.sort(key=lambda x: (x.get('student_id') or '').strip().upper())
+    all_faculty_records.sort(key=itemgetter('student_id'))
     
-    return jsonify(all_faculty_records)
+    response = _json_response(all_faculty_records)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 
@@ -456,12 +1017,12 @@ def api_attendance():
 def api_update_attendance():
     """Update attendance record with new check-in/check-out times."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         data = request.get_json()
         if not data:
-            return jsonify({"success": False, "error": "No data provided"})
+            return _json_response({"success": False, "error": "No data provided"})
         
         faculty_id = data.get('faculty_id', '').strip().upper()
         date_str = data.get('date', '').strip()
@@ -477,20 +1038,23 @@ def api_update_attendance():
             new_checkout = data.get('checkout', '').strip() if data.get('checkout') else ''
         
         if not faculty_id or not date_str:
-            return jsonify({"success": False, "error": "Faculty ID and date are required"})
+            return _json_response({"success": False, "error": "Faculty ID and date are required"})
         
         # Load the attendance file directly from source
         source_dir = get_attendance_dir()
         source_file = source_dir / f"{date_str}.json"
         if not source_file.exists():
-            return jsonify({"success": False, "error": f"Attendance file for {date_str} not found"})
+            return _json_response({"success": False, "error": f"Attendance file for {date_str} not found"})
         
         # Read current data
-        with source_file.open('r', encoding='utf-8') as f:
-            records = json.load(f)
+        records = _load_json_cached(source_file)
         
         if not isinstance(records, list):
-            return jsonify({"success": False, "error": "Invalid data format"})
+            return _json_response({"success": False, "error": "Invalid data format"})
+        
+        # Normalize faculty IDs once so matching and sorting below are plain field reads
+        for record in records:
+            record['student_id'] = (record.get('student_id') or '').strip().upper()
         
         # Find and update the specific record
         updated = False
@@ -498,73 +1062,34 @@ def api_update_attendance():
         
         # If we're updating check-in, find the record that has the current check-in time
         # If we're updating check-out, find the record that has the current check-out time
+        # (matching also requires the check-in time when one is provided).
+        # Falls back to the first record of this faculty (for backward compatibility).
+        current_checkin_time = data.get('current_checkin', '')
+        current_checkout_time = data.get('current_checkout', '')
         target_record = None
+        first_match = None
         
-        if new_checkin is not None:
-            # Find record with matching check-in time (or empty check-in if we're adding one)
-            current_checkin_time = data.get('current_checkin', '')
-            for record in records:
-                if record.get('student_id', '').strip().upper() == faculty_id:
-                    record_checkin = record.get('checkin', '')
-                    # Convert to time-only format for comparison
-                    record_checkin_time = ''
-                    if record_checkin:
-                        try:
-                            dt = parse_ts(record_checkin)
-                            if dt:
-                                record_checkin_time = dt.strftime("%H:%M:%S")
-                        except:
-                            pass
-                    
-                    # Match if current check-in time matches what we're trying to edit
-                    if record_checkin_time == current_checkin_time:
-                        target_record = record
-                        break
-        elif new_checkout is not None:
-            # Find record with matching check-out time (or empty check-out if we're adding one)
-            current_checkout_time = data.get('current_checkout', '')
-            current_checkin_time = data.get('current_checkin', '')
-            
-            for record in records:
-                if record.get('student_id', '').strip().upper() == faculty_id:
-                    record_checkout = record.get('checkout', '')
-                    record_checkin = record.get('checkin', '')
-                    
-                    # Convert to time-only format for comparison
-                    record_checkout_time = ''
-                    if record_checkout:
-                        try:
-                            dt = parse_ts(record_checkout)
-                            if dt:
-                                record_checkout_time = dt.strftime("%H:%M:%S")
-                        except:
-                            pass
-                    
-                    record_checkin_time = ''
-                    if record_checkin:
-                        try:
-                            dt = parse_ts(record_checkin)
-                            if dt:
-                                record_checkin_time = dt.strftime("%H:%M:%S")
-                        except:
-                            pass
-                    
-                    # Match if current check-out time matches AND check-in time matches (if provided)
-                    checkout_match = record_checkout_time == current_checkout_time
-                    checkin_match = True  # Default to True if no current_checkin provided
-                    if current_checkin_time:
-                        checkin_match = record_checkin_time == current_checkin_time
-                    
-                    if checkout_match and checkin_match:
-                        target_record = record
-                        break
-        
-        # If no specific record found, fall back to first match (for backward compatibility)
-        if not target_record:
-            for record in records:
-                if record.get('student_id', '').strip().upper() == faculty_id:
+        for record in records:
+            if record['student_id'] != faculty_id:
+                continue
+            if first_match is None:
+                first_match = record
+            if new_checkin is not None:
+                if _ts_to_hhmmss(record.get('checkin', ''), '') == current_checkin_time:
                     target_record = record
                     break
+            elif new_checkout is not None:
+                if _ts_to_hhmmss(record.get('checkout', ''), '') != current_checkout_time:
+                    continue
+                if current_checkin_time and _ts_to_hhmmss(record.get('checkin', ''), '') != current_checkin_time:
+                    continue
+                target_record = record
+                break
+            else:
+                break
+        
+        if not target_record:
+            target_record = first_match
         
         if target_record:
             record_found = True
@@ -581,7 +1106,7 @@ def api_update_attendance():
                         full_datetime = datetime.combine(date_obj, time_obj)
                         target_record['checkin'] = full_datetime.isoformat()
                     except ValueError:
-                        return jsonify({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
+                        return _json_response({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
             
             # Update check-out time if provided
             if new_checkout is not None:
@@ -595,7 +1120,7 @@ def api_update_attendance():
                         full_datetime = datetime.combine(date_obj, time_obj)
                         target_record['checkout'] = full_datetime.isoformat()
                     except ValueError:
-                        return jsonify({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
+                        return _json_response({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
             
             updated = True
         
@@ -626,7 +1151,7 @@ def api_update_attendance():
                         full_datetime = datetime.combine(date_obj, time_obj)
                         new_record['checkin'] = full_datetime.isoformat()
                     except ValueError:
-                        return jsonify({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
+                        return _json_response({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
             
             # Update check-out time if provided
             if new_checkout is not None:
@@ -640,76 +1165,75 @@ def api_update_attendance():
                         full_datetime = datetime.combine(date_obj, time_obj)
                         new_record['checkout'] = full_datetime.isoformat()
                     except ValueError:
-                        return jsonify({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
+                        return _json_response({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
             
             # Add new record to the list
             records.append(new_record)
             updated = True
         
         # Sort records by faculty ID, then by check-in time
-        records.sort(key=lambda x: (
-            (x.get('student_id') or '').strip().upper(),
-            x.get('checkin', '') or ''
-        ))
+        records.sort(key=_record_sort_key)
         
         # Recalculate delays for this faculty
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
+        faculty_records = [r for r in records if r['student_id'] == faculty_id]
         if faculty_records:
             staff_type = determine_staff_type(faculty_id)
             delay_val = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
             # Update delay for all records of this faculty
             for record in records:
-                if record.get('student_id', '').strip().upper() == faculty_id:
+                if record['student_id'] == faculty_id:
                     record['delay'] = delay_val
         
         # Save updated data directly to source file
-        with source_file.open('w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+        _dump_json(source_file, records)
         
-        return jsonify({"success": True, "message": "Attendance updated successfully"})
+        return _json_response({"success": True, "message": "Attendance updated successfully"})
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to update attendance: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to update attendance: {str(e)}"})
 
 
 @app.route("/api/attendance/delete", methods=["POST"])
 def api_delete_attendance():
     """Delete attendance record for a specific faculty member and date."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         data = request.get_json()
         if not data:
-            return jsonify({"success": False, "error": "No data provided"})
+            return _json_response({"success": False, "error": "No data provided"})
         
         faculty_id = data.get('faculty_id', '').strip().upper()
         date_str = data.get('date', '').strip()
         
         if not faculty_id or not date_str:
-            return jsonify({"success": False, "error": "Faculty ID and date are required"})
+            return _json_response({"success": False, "error": "Faculty ID and date are required"})
         
         # Load the attendance file directly from source
         source_dir = get_attendance_dir()
         source_file = source_dir / f"{date_str}.json"
         if not source_file.exists():
-            return jsonify({"success": False, "error": f"Attendance file for {date_str} not found"})
+            return _json_response({"success": False, "error": f"Attendance file for {date_str} not found"})
         
         # Read current data
-        with source_file.open('r', encoding='utf-8') as f:
-            records = json.load(f)
+        records = _load_json_cached(source_file)
         
         if not isinstance(records, list):
-            return jsonify({"success": False, "error": "Invalid data format"})
+            return _json_response({"success": False, "error": "Invalid data format"})
+        
+        # Normalize faculty IDs once so matching below is a plain comparison
+        for record in records:
+            record['student_id'] = (record.get('student_id') or '').strip().upper()
         
         # Find and remove all records for this faculty member
         original_count = len(records)
-        records = [r for r in records if r.get('student_id', '').strip().upper() != faculty_id]
+        records = [r for r in records if r['student_id'] != faculty_id]
         removed_count = original_count - len(records)
         
         if removed_count == 0:
-            return jsonify({"success": False, "error": f"No records found for faculty {faculty_id} on {date_str}"})
+            return _json_response({"success": False, "error": f"No records found for faculty {faculty_id} on {date_str}"})
         
         # Create a placeholder record for the deleted faculty member
         faculty_details = load_faculty_details()
@@ -725,13 +1249,12 @@ def api_delete_attendance():
         
         # Insert the placeholder record in the correct sorted position
         records.append(placeholder_record)
-        records.sort(key=lambda x: (x.get('student_id') or '').strip().upper())
+        records.sort(key=itemgetter('student_id'))
         
         # Save updated data directly to source file
-        with source_file.open('w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+        _dump_json(source_file, records)
         
-        return jsonify({
+        return _json_response({
             "success": True, 
             "message": f"Successfully deleted {removed_count} record(s) for {faculty_id} and created placeholder record",
             "deleted_count": removed_count,
@@ -739,14 +1262,14 @@ def api_delete_attendance():
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to delete attendance: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to delete attendance: {str(e)}"})
 
 
 @app.route("/api/faculty-list")
 def api_faculty_list():
     """Get list of all faculty members for dropdown."""
     if not is_logged_in():
-        return jsonify({"error": "Not authenticated"}), 401
+        return _json_response({"error": "Not authenticated"}, 401)
     
     try:
         faculty_details = load_faculty_details()
@@ -759,23 +1282,23 @@ def api_faculty_list():
             })
         
         # Sort by faculty ID
-        faculty_list.sort(key=lambda x: x["id"])
+        faculty_list.sort(key=itemgetter("id"))
         
-        return jsonify(faculty_list)
+        return _json_response(faculty_list)
     except Exception as e:
-        return jsonify({"error": f"Failed to load faculty list: {str(e)}"}), 500
+        return _json_response({"error": f"Failed to load faculty list: {str(e)}"}, 500)
 
 
 @app.route("/api/attendance/add", methods=["POST"])
 def api_add_attendance():
     """Add a new attendance record for a faculty member."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         data = request.get_json()
         if not data:
-            return jsonify({"success": False, "error": "No data provided"})
+            return _json_response({"success": False, "error": "No data provided"})
         
         faculty_id = data.get('faculty_id', '').strip().upper()
         date_str = data.get('date', '').strip()
@@ -783,231 +1306,340 @@ def api_add_attendance():
         checkout_time = data.get('checkout', '').strip()
         
         if not faculty_id or not date_str:
-            return jsonify({"success": False, "error": "Faculty ID and date are required"})
+            return _json_response({"success": False, "error": "Faculty ID and date are required"})
         
         # Load the attendance file directly from source
         source_dir = get_attendance_dir()
         source_file = source_dir / f"{date_str}.json"
         
-        # Read current data
-        records = []
-        if source_file.exists():
-            with source_file.open('r', encoding='utf-8') as f:
-                records = json.load(f)
-        
-        if not isinstance(records, list):
-            records = []
-        
-        # Get faculty details
-        faculty_details = load_faculty_details()
-        faculty_info = faculty_details.get(faculty_id.upper(), {})
-        
-        # Create new record with provided times
-        new_record = {
-            'student_id': faculty_id,
-            'name': faculty_info.get('name', ''),
-            'checkin': '',
-            'checkout': '',
-            'delay': 'N/A'
-        }
-        
-        # Set check-in time if provided
-        if checkin_time:
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                time_obj = datetime.strptime(checkin_time, "%H:%M:%S").time()
-                full_datetime = datetime.combine(date_obj, time_obj)
-                new_record['checkin'] = full_datetime.isoformat()
-            except ValueError:
-                return jsonify({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
-        
-        # Set check-out time if provided
-        if checkout_time:
-            try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                time_obj = datetime.strptime(checkout_time, "%H:%M:%S").time()
-                full_datetime = datetime.combine(date_obj, time_obj)
-                new_record['checkout'] = full_datetime.isoformat()
-            except ValueError:
-                return jsonify({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
-        
-        # Add new record
-        records.append(new_record)
-        
-        # Sort all records by faculty ID, then by check-in time
-        records.sort(key=lambda x: (
-            (x.get('student_id') or '').strip().upper(),
-            x.get('checkin', '') or ''
-        ))
-        
-        # Recalculate delays for this faculty
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-        if faculty_records:
+        with DayFile(source_file) as day:
+            records = day.records if isinstance(day.records, list) else []
+            
+            # Normalize faculty IDs once so matching and sorting below are plain field reads
+            for record in records:
+                record['student_id'] = (record.get('student_id') or '').strip().upper()
+            
+            # Get faculty details
+            faculty_details = load_faculty_details()
+            faculty_info = faculty_details.get(faculty_id, {})
+            
+            # Create new record with provided times
+            new_record = {
+                'student_id': faculty_id,
+                'name': faculty_info.get('name', ''),
+                'checkin': '',
+                'checkout': '',
+                'delay': 'N/A'
+            }
+            
+            # Set check-in time if provided
+            if checkin_time:
+                try:
+                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                    time_obj = datetime.strptime(checkin_time, "%H:%M:%S").time()
+                    full_datetime = datetime.combine(date_obj, time_obj)
+                    new_record['checkin'] = full_datetime.isoformat()
+                except ValueError:
+                    return _json_response({"success": False, "error": "Invalid check-in time format. Use HH:MM:SS"})
+            
+            # Set check-out time if provided
+            if checkout_time:
+                try:
+                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                    time_obj = datetime.strptime(checkout_time, "%H:%M:%S").time()
+                    full_datetime = datetime.combine(date_obj, time_obj)
+                    new_record['checkout'] = full_datetime.isoformat()
+                except ValueError:
+                    return _json_response({"success": False, "error": "Invalid check-out time format. Use HH:MM:SS"})
+            
+            # Add new record
+            records.append(new_record)
+            
+            # Sort all records by faculty ID, then by check-in time
+            records.sort(key=_record_sort_key)
+            
+            # Recalculate delays for this faculty
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            faculty_records = [r for r in records if r['student_id'] == faculty_id]
             staff_type = determine_staff_type(faculty_id)
             delay_val = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
             # Update delay for all records of this faculty
-            for record in records:
-                if record.get('student_id', '').strip().upper() == faculty_id:
-                    record['delay'] = delay_val
-        
-        # Save updated data directly to source file
-        with source_file.open('w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+            for record in faculty_records:
+                record['delay'] = delay_val
+            
+            # Save updated data directly to source file (on leaving the block)
+            day.records = records
+            day.save()
         
-        return jsonify({
+        return _json_response({
             "success": True, 
             "message": f"Successfully added new record for {faculty_id}"
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to add attendance: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to add attendance: {str(e)}"})
 
 
 @app.route("/api/attendance/delete-specific", methods=["POST"])
 def api_delete_specific_attendance():
     """Delete a specific attendance record by index."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         data = request.get_json()
         if not data:
-            return jsonify({"success": False, "error": "No data provided"})
+            return _json_response({"success": False, "error": "No data provided"})
         
         faculty_id = data.get('faculty_id', '').strip().upper()
         date_str = data.get('date', '').strip()
         record_index = data.get('record_index', 0)
         
         if not faculty_id or not date_str:
-            return jsonify({"success": False, "error": "Faculty ID and date are required"})
+            return _json_response({"success": False, "error": "Faculty ID and date are required"})
         
         # Load the attendance file directly from source
         source_dir = get_attendance_dir()
         source_file = source_dir / f"{date_str}.json"
         if not source_file.exists():
-            return jsonify({"success": False, "error": f"Attendance file for {date_str} not found"})
-        
-        # Read current data
-        with source_file.open('r', encoding='utf-8') as f:
-            records = json.load(f)
-        
-        if not isinstance(records, list):
-            return jsonify({"success": False, "error": "Invalid data format"})
-        
-        # Find all records for this faculty member
-        faculty_records = [i for i, r in enumerate(records) if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-        
-        if not faculty_records:
-            return jsonify({"success": False, "error": f"No records found for faculty {faculty_id}"})
-        
-        if record_index >= len(faculty_records):
-            return jsonify({"success": False, "error": "Invalid record index"})
+            return _json_response({"success": False, "error": f"Attendance file for {date_str} not found"})
         
-        # Get the actual record index in the full list
-        actual_index = faculty_records[record_index]
-        
-        # Remove the specific record
-        deleted_record = records.pop(actual_index)
-        
-        # If no more records exist for this faculty, create a placeholder
-        remaining_faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-        
-        if not remaining_faculty_records:
-            # Create placeholder record
-            faculty_details = load_faculty_details()
-            faculty_info = faculty_details.get(faculty_id.upper(), {})
+        with DayFile(source_file) as day:
+            records = day.records
             
-            placeholder_record = {
-                'student_id': faculty_id,
-                'name': faculty_info.get('name', ''),
-                'checkin': '',
-                'checkout': '',
-                'delay': 'N/A'
-            }
+            if not isinstance(records, list):
+                return _json_response({"success": False, "error": "Invalid data format"})
             
-            records.append(placeholder_record)
-            placeholder_created = True
-        else:
-            placeholder_created = False
-        
-        # Sort all records by faculty ID
-        records.sort(key=lambda x: (x.get('student_id') or '').strip().upper())
-        
-        # Save updated data directly to source file
-        with source_file.open('w', encoding='utf-8') as f:
-            json.dump(records, f, ensure_ascii=False, indent=2)
+            # Normalize faculty IDs once so matching below is a plain comparison
+            for record in records:
+                record['student_id'] = (record.get('student_id') or '').strip().upper()
+            
+            # Find all records for this faculty member
+            faculty_records = [i for i, r in enumerate(records) if r['student_id'] == faculty_id]
+            
+            if not faculty_records:
+                return _json_response({"success": False, "error": f"No records found for faculty {faculty_id}"})
+            
+            if record_index >= len(faculty_records):
+                return _json_response({"success": False, "error": "Invalid record index"})
+            
+            # Get the actual record index in the full list
+            actual_index = faculty_records[record_index]
+            
+            # Remove the specific record
+            deleted_record = records.pop(actual_index)
+            
+            # If no more records exist for this faculty, create a placeholder
+            remaining_faculty_records = [r for r in records if r['student_id'] == faculty_id]
+            
+            if not remaining_faculty_records:
+                # Create placeholder record
+                faculty_details = load_faculty_details()
+                faculty_info = faculty_details.get(faculty_id.upper(), {})
+                
+                placeholder_record = {
+                    'student_id': faculty_id,
+                    'name': faculty_info.get('name', ''),
+                    'checkin': '',
+                    'checkout': '',
+                    'delay': 'N/A'
+                }
+                
+                records.append(placeholder_record)
+                placeholder_created = True
+            else:
+                placeholder_created = False
+            
+            # Sort all records by faculty ID
+            records.sort(key=itemgetter('student_id'))
+            
+            # Save updated data directly to source file (on leaving the block)
+            day.save()
         
-        return jsonify({
+        return _json_response({
             "success": True, 
             "message": f"Successfully deleted record for {faculty_id}",
             "placeholder_created": placeholder_created
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to delete attendance: {str(e)}"})
-
-
-@app.route("/api/monthly-delay-report", methods=["GET"])
-def api_monthly_delay_report():
-    """Get monthly delay report data."""
-    if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
-    
+        return _json_response({"success": False, "error": f"Failed to delete attendance: {str(e)}"})
+
+
+MONTHLY_AGGREGATE_DIR = Path.cwd() / "JSON" / "aggregates"
+# Bump when the delay logic changes; together with the threshold digest this marks
+# which rules a stored aggregate was computed with, so an upgrade recomputes them
+AGGREGATE_VERSION = 1
+AGGREGATE_RULES = f"{AGGREGATE_VERSION}:" + hashlib.sha1(
+    repr(sorted(_THRESHOLDS.items())).encode()).hexdigest()
+MONTH_READ_WORKERS = 8
+
+# Report titles always use English month names, whatever the server locale
+MONTH_NAMES = {
+    '01': 'January', '02': 'February', '03': 'March', '04': 'April',
+    '05': 'May', '06': 'June', '07': 'July', '08': 'August',
+    '09': 'September', '10': 'October', '11': 'November', '12': 'December'
+}
+
+def _days_in_month(month: str, year: str) -> int:
+    """Number of days in the month, or 0 when month/year don't name a real month."""
     try:
-        month = request.args.get('month')
-        year = request.args.get('year')
-        
-        if not month or not year:
-            return jsonify({"success": False, "error": "Month and year are required"})
+        year_num, month_num = int(year), int(month)
+        datetime(year_num, month_num, 1)  # also rejects years datetime can't represent
+        return monthrange(year_num, month_num)[1]
+    except ValueError:
+        return 0
+
+def _aggregate_month(source_dir: Path, month: str, year: str, wanted_ids: set) -> Dict[str, Dict[str, int]]:
+    """Sum daily delay seconds and count days with records per faculty ID.
+    Day files are read concurrently, once each, and their records bucketed by faculty.
+    """
+    total_delay_seconds: Dict[str, int] = defaultdict(int)
+    days_with_records: Dict[str, int] = defaultdict(int)
+    
+    mm = month.zfill(2)
+    
+    def load_day(day: int) -> List[Dict[str, Any]] | None:
+        source_file = source_dir / f"{year}-{mm}-{day:02d}.json"
+        if not source_file.exists():
+            return None
+        try:
+            return _load_json_cached(source_file, copy=False)
+        except JSON_READ_ERRORS:
+            return None
+    
+    # Day files are independent, so read/parse them concurrently
+    days = range(1, _days_in_month(month, year) + 1)
+    with ThreadPoolExecutor(max_workers=MONTH_READ_WORKERS) as executor:
+        day_records = list(executor.map(load_day, days))
+    
+    for day, records in zip(days, day_records):
+        if records is None:
+            continue
+        date_obj = datetime(int(year), int(month), day)
         
-        # Get monthly delay data
-        monthly_delays = []
-        faculty_details = load_faculty_details()
+        by_id = defaultdict(list)
+        for r in records:
+            sid = (r.get('student_id') or '').strip().upper()
+            if sid in wanted_ids:
+                by_id[sid].append(r)
         
-        for faculty_id, faculty_info in faculty_details.items():
-            total_delay_seconds = 0
-            days_with_records = 0
-            
-            for day in range(1, 32):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                        
-                        if faculty_records:
-                            days_with_records += 1
-                            staff_type = determine_staff_type(faculty_id)
-                            daily_delay = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                            
-                            if daily_delay != 'N/A':
-                                delay_parts = daily_delay.split(':')
-                                if len(delay_parts) == 3:
-                                    hours, minutes, seconds = map(int, delay_parts)
-                                    total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                
-                except ValueError:
-                    continue
-            
-            total_delay = 'N/A' if days_with_records == 0 else _seconds_to_hhmmss(total_delay_seconds)
-            
-            monthly_delays.append({
-                'faculty_id': faculty_id,
-                'name': faculty_info.get('name', ''),
-                'total_delay': total_delay
-            })
+        for sid, faculty_records in by_id.items():
+            days_with_records[sid] += 1
+            total_delay_seconds[sid] += compute_daily_delay_seconds(faculty_records, date_obj, determine_staff_type(sid))
+    
+    return {'total_delay_seconds': dict(total_delay_seconds), 'days_with_records': dict(days_with_records)}
+
+def _month_file_stamps(source_dir: Path, month: str, year: str) -> Dict[str, List[int]]:
+    stamps = {}
+    mm = month.zfill(2)
+    for day in range(1, _days_in_month(month, year) + 1):
+        date_str = f"{year}-{mm}-{day:02d}"
+        try:
+            st = (source_dir / f"{date_str}.json").stat()
+        except OSError:
+            continue
+        stamps[date_str] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+def compute_monthly_aggregate(month: str, year: str) -> Dict[str, Any]:
+    """Per-faculty monthly totals, persisted under JSON/aggregates/YYYY-MM.json.
+    The stored aggregate is reused while the month's day files and
+    faculty_detail.json are unchanged (same mtime and size) and it was computed
+    with the current delay rules (AGGREGATE_RULES); otherwise it is recomputed
+    and rewritten.
+    """
+    faculty_details = load_faculty_details()
+    source_dir = get_attendance_dir()
+    # Only real months are cached (month=13 or year=99999 are not)
+    cacheable = month.isdigit() and year.isdigit() and _days_in_month(month, year) > 0
+    # Stamp before reading so a concurrent write makes the stored copy stale
+    stamps = _month_file_stamps(source_dir, month, year) if cacheable else {}
+    faculty_stamp = list(_faculty_file_stamp() or [])
+    aggregate_path = MONTHLY_AGGREGATE_DIR / f"{year}-{month.zfill(2)}.json"
+    
+    if cacheable and aggregate_path.exists():
+        try:
+            stored = _load_json(aggregate_path)
+            if (isinstance(stored, dict) and stored.get('rules') == AGGREGATE_RULES
+                    and stored.get('source_dir') == str(source_dir)
+                    and stored.get('stamps') == stamps and stored.get('faculty_stamp') == faculty_stamp):
+                return stored
+        except JSON_READ_ERRORS:
+            pass
+    
+    wanted_ids = {faculty_id.upper() for faculty_id in faculty_details}
+    aggregate = _aggregate_month(source_dir, month, year, wanted_ids)
+    aggregate.update(rules=AGGREGATE_RULES, source_dir=str(source_dir), stamps=stamps, faculty_stamp=faculty_stamp)
+    # Nothing worth storing for a month without day files; a GET must not leave one behind
+    if cacheable and stamps:
+        try:
+            MONTHLY_AGGREGATE_DIR.mkdir(parents=True, exist_ok=True)
+            _dump_json(aggregate_path, aggregate)
+        except OSError:
+            pass
+    return aggregate
+
+def compute_monthly_delays(month: str, year: str) -> List[Dict[str, Any]]:
+    """Total delay per faculty for the given month, sorted by faculty ID.
+    'N/A' marks faculty without any records in the month.
+    """
+    faculty_details = load_faculty_details()
+    aggregate = compute_monthly_aggregate(month, year)
+    total_delay_seconds = aggregate['total_delay_seconds']
+    days_with_records = aggregate['days_with_records']
+    
+    monthly_delays = []
+    for faculty_id, faculty_info in faculty_details.items():
+        sid = faculty_id.upper()
+        total_delay = 'N/A' if not days_with_records.get(sid) else _seconds_to_hhmmss(total_delay_seconds.get(sid, 0))
+        monthly_delays.append({
+            'faculty_id': faculty_id,
+            'name': faculty_info.get('name', ''),
+            'total_delay': total_delay
+        })
+    
+    monthly_delays.sort(key=itemgetter('faculty_id'))
+    return monthly_delays
+
+
+def _xl_set_widths(ws, widths) -> None:
+    """Set the widths of columns A, B, ... in order (before the first row on write-only sheets)."""
+    column_dimensions = ws.column_dimensions
+    for i, width in enumerate(widths, 1):
+        column_dimensions[get_column_letter(i)].width = width
+
+def _xl_cell(ws, value, font=None, fill=None, border=None, alignment=None):
+    """WriteOnlyCell carrying the given (shared) style objects."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+@app.route("/api/monthly-delay-report", methods=["GET"])
+def api_monthly_delay_report():
+    """Get monthly delay report data."""
+    if not is_logged_in():
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
+    
+    try:
+        month = request.args.get('month')
+        year = request.args.get('year')
         
-        monthly_delays.sort(key=lambda x: x['faculty_id'])
+        if not month or not year:
+            return _json_response({"success": False, "error": "Month and year are required"})
+        
+        # Get monthly delay data
+        monthly_delays = compute_monthly_delays(month, year)
         
-        return jsonify({
+        return _json_response({
             "success": True,
             "data": monthly_delays,
             "month": month,
@@ -1015,84 +1647,31 @@ def api_monthly_delay_report():
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to get monthly delay report: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to get monthly delay report: {str(e)}"})
 
 
 @app.route("/api/monthly-delay-report/excel", methods=["GET"])
 def api_monthly_delay_report_excel():
     """Export monthly delay report as Excel file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         month = request.args.get('month')
         year = request.args.get('year')
         
         if not month or not year:
-            return jsonify({"success": False, "error": "Month and year are required"})
+            return _json_response({"success": False, "error": "Month and year are required"})
         
         # Get monthly delay data
-        monthly_delays = []
-        faculty_details = load_faculty_details()
+        monthly_delays = compute_monthly_delays(month, year)
         
-        for faculty_id, faculty_info in faculty_details.items():
-            total_delay_seconds = 0
-            days_with_records = 0
-            
-            for day in range(1, 32):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                        
-                        if faculty_records:
-                            days_with_records += 1
-                            staff_type = determine_staff_type(faculty_id)
-                            daily_delay = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                            
-                            if daily_delay != 'N/A':
-                                delay_parts = daily_delay.split(':')
-                                if len(delay_parts) == 3:
-                                    hours, minutes, seconds = map(int, delay_parts)
-                                    total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                
-                except ValueError:
-                    continue
-            
-            total_delay = 'N/A' if days_with_records == 0 else _seconds_to_hhmmss(total_delay_seconds)
-            
-            monthly_delays.append({
-                'faculty_id': faculty_id,
-                'name': faculty_info.get('name', ''),
-                'total_delay': total_delay
-            })
-        
-        monthly_delays.sort(key=lambda x: x['faculty_id'])
-        
-        # Create Excel workbook
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
-        
-        wb = Workbook()
-        ws = wb.active
-        ws.title = f"Monthly Delay Report {month}-{year}"
+        # Create Excel workbook (write-only: rows are streamed, not kept as cells)
+        wb = new_xl_workbook()
+        ws = wb.create_sheet(title=f"Monthly Delay Report {month}-{year}")
         
         # Convert month number to month name
-        month_names = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        month_name = month_names.get(month.zfill(2), month)
+        month_name = MONTH_NAMES.get(month.zfill(2), month)
         
         # Meta table - Report Information
         meta_data = [
@@ -1104,93 +1683,54 @@ def api_monthly_delay_report_excel():
             ['', ''],  # Empty row for spacing
         ]
         
+        meta_rows = [item for item in meta_data if item[0] and item[1]]
+        headers = ['Faculty ID', 'Name', 'Total Delay']
+        
+        # Column widths from the data (write-only sheets can't be rescanned);
+        # blank cells counted as 'None' in the old auto-fit, hence the floor of 4
+        columns = [
+            [key for key, _ in meta_rows] + [row['faculty_id'] for row in monthly_delays],
+            [value for _, value in meta_rows] + [row['name'] for row in monthly_delays],
+            [row['total_delay'] for row in monthly_delays],
+        ]
+        _xl_set_widths(ws, [
+            min(max([4, len(header)] + [len(str(value)) for value in values]) + 2, 50)
+            for header, values in zip(headers, columns)
+        ])
+        
         # Add meta table
-        for row_idx, (key, value) in enumerate(meta_data, 1):
+        for key, value in meta_data:
             if key and value:  # Skip empty rows
-                # Key column
-                key_cell = ws.cell(row=row_idx, column=1, value=key)
-                key_cell.font = Font(bold=True, size=11)
-                key_cell.fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-                key_cell.border = Border(
-                    left=Side(style='thin', color='000000'),
-                    right=Side(style='thin', color='000000'),
-                    top=Side(style='thin', color='000000'),
-                    bottom=Side(style='thin', color='000000')
-                )
-                
-                # Value column
-                value_cell = ws.cell(row=row_idx, column=2, value=value)
-                value_cell.font = Font(size=11)
-                value_cell.fill = PatternFill(start_color="F0F8FF", end_color="F0F8FF", fill_type="solid")
-                value_cell.alignment = Alignment(horizontal="left", vertical="center")
-                value_cell.border = Border(
-                    left=Side(style='thin', color='000000'),
-                    right=Side(style='thin', color='000000'),
-                    top=Side(style='thin', color='000000'),
-                    bottom=Side(style='thin', color='000000')
-                )
+                ws.append([
+                    _xl_cell(ws, key, font=_XL_FONT_BOLD, fill=_xl_fill("E6F3FF"), border=_XL_BORDER_THIN),
+                    _xl_cell(ws, value, font=_XL_FONT, fill=_xl_fill("F0F8FF"), alignment=_XL_LEFT,
+                             border=_XL_BORDER_THIN),
+                ])
+            else:
+                ws.append([])
         
         # Main data table starts after meta table
-        data_start_row = len([item for item in meta_data if item[0] and item[1]]) + 3
+        data_start_row = len(meta_rows) + 3
+        for _ in range(len(meta_data), data_start_row - 1):
+            ws.append([])
         
         # Main table headers
-        headers = ['Faculty ID', 'Name', 'Total Delay']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=data_start_row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF", size=12)
-            cell.fill = PatternFill(start_color="2F4F4F", end_color="2F4F4F", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = Border(
-                left=Side(style='medium', color='000000'),
-                right=Side(style='medium', color='000000'),
-                top=Side(style='medium', color='000000'),
-                bottom=Side(style='medium', color='000000')
-            )
+        ws.append([_xl_cell(ws, header, font=_XL_FONT_HEADER, fill=_xl_fill("2F4F4F"), alignment=_XL_CENTER,
+                            border=_XL_BORDER_MEDIUM) for header in headers])
         
-        # Data rows
+        # Data rows with borders and alternating row colors
         for row, delay_data in enumerate(monthly_delays, data_start_row + 1):
-            # Faculty ID
-            id_cell = ws.cell(row=row, column=1, value=delay_data['faculty_id'])
-            id_cell.font = Font(bold=True, size=11)
-            id_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Name
-            name_cell = ws.cell(row=row, column=2, value=delay_data['name'])
-            name_cell.font = Font(size=11)
-            name_cell.alignment = Alignment(horizontal="left", vertical="center")
-            
-            # Total Delay
-            delay_cell = ws.cell(row=row, column=3, value=delay_data['total_delay'])
-            delay_cell.font = Font(size=11)
-            delay_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Add borders and alternating row colors
-            row_color = "FFFFFF" if row % 2 == 0 else "F8F9FA"
-            for col in range(1, 4):
-                cell = ws.cell(row=row, column=col)
-                cell.fill = PatternFill(start_color=row_color, end_color=row_color, fill_type="solid")
-                cell.border = Border(
-                    left=Side(style='thin', color='000000'),
-                    right=Side(style='thin', color='000000'),
-                    top=Side(style='thin', color='000000'),
-                    bottom=Side(style='thin', color='000000')
-                )
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            fill = _xl_fill("FFFFFF" if row % 2 == 0 else "F8F9FA")
+            ws.append([
+                _xl_cell(ws, delay_data['faculty_id'], font=_XL_FONT_BOLD, fill=fill, alignment=_XL_CENTER,
+                         border=_XL_BORDER_THIN),
+                _xl_cell(ws, delay_data['name'], font=_XL_FONT, fill=fill, alignment=_XL_LEFT,
+                         border=_XL_BORDER_THIN),
+                _xl_cell(ws, delay_data['total_delay'], font=_XL_FONT, fill=fill, alignment=_XL_CENTER,
+                         border=_XL_BORDER_THIN),
+            ])
         
         # Save to BytesIO
-        from io import BytesIO
         output = BytesIO()
         wb.save(output)
         output.seek(0)
@@ -1202,89 +1742,30 @@ def api_monthly_delay_report_excel():
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export Excel: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export Excel: {str(e)}"})
 
 
 @app.route("/api/monthly-delay-report/pdf", methods=["GET"])
 def api_monthly_delay_report_pdf():
     """Export monthly delay report as PDF file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         month = request.args.get('month')
         year = request.args.get('year')
         
         if not month or not year:
-            return jsonify({"success": False, "error": "Month and year are required"})
+            return _json_response({"success": False, "error": "Month and year are required"})
         
         # Get monthly delay data
-        monthly_delays = []
-        faculty_details = load_faculty_details()
-        
-        for faculty_id, faculty_info in faculty_details.items():
-            total_delay_seconds = 0
-            days_with_records = 0
-            
-            for day in range(1, 32):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                        
-                        if faculty_records:
-                            days_with_records += 1
-                            staff_type = determine_staff_type(faculty_id)
-                            daily_delay = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                            
-                            if daily_delay != 'N/A':
-                                delay_parts = daily_delay.split(':')
-                                if len(delay_parts) == 3:
-                                    hours, minutes, seconds = map(int, delay_parts)
-                                    total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                
-                except ValueError:
-                    continue
-            
-            total_delay = 'N/A' if days_with_records == 0 else _seconds_to_hhmmss(total_delay_seconds)
-            
-            monthly_delays.append({
-                'faculty_id': faculty_id,
-                'name': faculty_info.get('name', ''),
-                'total_delay': total_delay
-            })
-        
-        monthly_delays.sort(key=lambda x: x['faculty_id'])
+        monthly_delays = compute_monthly_delays(month, year)
         
         # Create PDF with same template as daily attendance export
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from io import BytesIO
         
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        
         # Build content
         story = []
         
@@ -1294,79 +1775,30 @@ def api_monthly_delay_report_pdf():
         story.append(Spacer(1, 20))  # Space after header
         
         # Convert month number to month name
-        month_names = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        month_name = month_names.get(month.zfill(2), month)
+        month_name = MONTH_NAMES.get(month.zfill(2), month)
         
         # Report title (centered with proper spacing)
-        report_title_style = ParagraphStyle(
-            'ReportTitle',
-            parent=styles['Heading2'],
-            fontSize=16,  # Smaller font to save space
-            spaceAfter=12,  # Restore proper spacing
-            alignment=1,  # Center alignment
-            fontName='Helvetica-Bold',
-            textColor=colors.black
-        )
-        report_title = Paragraph("Monthly Delay Report", report_title_style)
+        report_title = Paragraph("Monthly Delay Report", _PDF_MONTHLY_TITLE_STYLE)
         story.append(report_title)
         
         # Month and year (centered with proper spacing)
-        month_style = ParagraphStyle(
-            'MonthStyle',
-            parent=styles['Normal'],
-            fontSize=14,  # Smaller font to save space
-            spaceAfter=20,  # Restore proper spacing
-            alignment=1,  # Center alignment
-            textColor=colors.grey,  # Gray color for subtitle
-            fontName='Helvetica'
-        )
-        month_text = Paragraph(f"Month: {month_name} {year}", month_style)
+        month_text = Paragraph(f"Month: {month_name} {year}", _PDF_MONTHLY_SUBTITLE_STYLE)
         story.append(month_text)
         story.append(Spacer(1, 20))  # Restore proper spacing
         
         # Create table data
-        table_data = [['Faculty ID', 'Name', 'Total Delay']]
-        for delay_data in monthly_delays:
-            table_data.append([
-                delay_data['faculty_id'],
-                delay_data['name'],
-                delay_data['total_delay']
-            ])
+        table_data = [['Faculty ID', 'Name', 'Total Delay']] + [
+            [delay_data['faculty_id'], delay_data['name'], delay_data['total_delay']]
+            for delay_data in monthly_delays
+        ]
         
         # Create table with larger fonts and professional styling
-        # repeatRows=1 ensures header is repeated on each page when table breaks
-        table = Table(table_data, colWidths=[90, 350, 90], repeatRows=1)  # Better column widths
-        table.setStyle(TableStyle([
-            # Header styling - black background with white text (applies to all header rows including repeated ones)
-            ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'LEFT'),  # Left align headers
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),  # Larger header font
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),  # Better padding
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-            # White vertical borders for header
-            ('LINEBEFORE', (0, 0), (0, 0), 1.0, colors.white),
-            ('LINEBEFORE', (1, 0), (1, 0), 1.0, colors.white),
-            ('LINEBEFORE', (2, 0), (2, 0), 1.0, colors.white),
-            ('LINEAFTER', (0, 0), (0, 0), 1.0, colors.white),
-            ('LINEAFTER', (1, 0), (1, 0), 1.0, colors.white),
-            ('LINEAFTER', (2, 0), (2, 0), 1.0, colors.white),
-            # Data row styling - alternating white and light grey
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),  # Left align data
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 11),  # Larger data font for better readability
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Better padding
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            # Black borders for all cells
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Clean borders
-        ]))
+        # repeatRows=1 ensures header is repeated on each page when table breaks;
+        # LongTable lays out long multi-page tables more cheaply; fixed row heights
+        # (header 32pt, rows 28pt, as the style's fonts and paddings give) skip per-cell measuring
+        table = LongTable(table_data, colWidths=[90, 350, 90],  # Better column widths
+                          rowHeights=[32] + [28] * (len(table_data) - 1), repeatRows=1)
+        table.setStyle(_MONTHLY_TABLE_STYLE)
         
         story.append(table)
         
@@ -1381,128 +1813,66 @@ def api_monthly_delay_report_pdf():
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export PDF: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export PDF: {str(e)}"})
 
 
 @app.route("/api/daily-attendance-report/excel", methods=["GET"])
 def api_daily_attendance_report_excel():
     """Export daily attendance report as Excel file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         date = request.args.get('date')
         if not date:
-            return jsonify({"success": False, "error": "Date is required"})
+            return _json_response({"success": False, "error": "Date is required"})
         
         # Get attendance data for the date
         source_dir = get_attendance_dir()
         source_file = source_dir / f"{date}.json"
         
         if not source_file.exists():
-            return jsonify({"success": False, "error": f"No attendance data found for {date}"})
-        
-        with source_file.open('r', encoding='utf-8') as f:
-            records = json.load(f)
+            return _json_response({"success": False, "error": f"No attendance data found for {date}"})
         
-        # Sort records by faculty ID
-        records.sort(key=lambda x: (x.get('student_id') or '').strip().upper())
+        records = _load_json_cached(source_file)
         
-        # Create Excel workbook with ONLY 5 columns using a different approach
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        # Sort records by (normalized) faculty ID
+        for record in records:
+            record['student_id'] = (record.get('student_id') or '').strip().upper()
+        records.sort(key=itemgetter('student_id'))
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = f"Faculty Attendance Report {date}"
+        # Create Excel workbook with ONLY 5 columns (write-only: rows are streamed)
+        wb = new_xl_workbook()
+        ws = wb.create_sheet(title=f"Faculty Attendance Report {date}")
         
-        # CRITICAL: Only work with columns A-E, ignore everything else
-        # Set column dimensions to 0 for all columns beyond E
-        for col in range(6, 50):  # Set columns F onwards to 0 width
-            ws.column_dimensions[chr(64 + col)].width = 0
-            ws.column_dimensions[chr(64 + col)].hidden = True
+        # Only columns A-E are ever written; unreferenced columns don't exist in the file
+        # Set column widths (only for 5 columns)
+        _xl_set_widths(ws, [15, 30, 15, 15, 15])  # Faculty ID, Name, Check-in, Check-out, Delay
         
         # Convert date format from YYYY-MM-DD to DD-MM-YYYY
         date_parts = date.split('-')
         formatted_date = f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
         
         # Report title
-        title_cell = ws.cell(row=1, column=1, value=f"Faculty Attendance Report - {formatted_date}")
-        title_cell.font = Font(bold=True, size=16)
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
+        ws.append([_xl_cell(ws, f"Faculty Attendance Report - {formatted_date}", font=_XL_FONT_TITLE,
+                            alignment=_XL_CENTER)])
         
         # Add some spacing
         ws.row_dimensions[2].height = 20
+        ws.append([])
         
         # Table headers (only 5 columns: Faculty ID, Name, Check-in, Check-out, Delay)
         headers = ['Faculty ID', 'Name', 'Check-in (Time)', 'Check-out (Time)', 'Delay (Time)']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF", size=12)  # White text
-            cell.fill = PatternFill(start_color="000000", end_color="000000", fill_type="solid")  # Black background
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-            cell.border = Border(
-                left=Side(style='medium', color='000000'),
-                right=Side(style='medium', color='000000'),
-                top=Side(style='medium', color='000000'),
-                bottom=Side(style='medium', color='000000')
-            )
-        
-        # Ensure any other columns beyond the 5 main columns have white background
-        for col in range(6, 50):  # Columns F onwards
-            cell = ws.cell(row=3, column=col, value="")
-            cell.fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")  # White background
-            cell.font = Font(color="000000", size=12)  # Black text
-            cell.border = Border(
-                left=Side(style='thin', color='000000'),
-                right=Side(style='thin', color='000000'),
-                top=Side(style='thin', color='000000'),
-                bottom=Side(style='thin', color='000000')
-            )
+        ws.append([_xl_cell(ws, header, font=_XL_FONT_HEADER, fill=_xl_fill("000000"),  # Black background
+                            alignment=_XL_CENTER, border=_XL_BORDER_MEDIUM) for header in headers])
         
-        # Data rows (only 5 columns)
-        for row, record in enumerate(records, 4):
-            # Faculty ID
-            id_cell = ws.cell(row=row, column=1, value=record.get('student_id', ''))
-            id_cell.font = Font(bold=True, size=11)
-            id_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Name
-            name_cell = ws.cell(row=row, column=2, value=record.get('name', ''))
-            name_cell.font = Font(size=11)
-            name_cell.alignment = Alignment(horizontal="left", vertical="center")
-            
-            # Check-in time
-            checkin = record.get('checkin', '')
-            if checkin and checkin != '':
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(checkin.replace('Z', '+00:00'))
-                    checkin_formatted = dt.strftime('%H:%M:%S')
-                except:
-                    checkin_formatted = 'Not recorded'
-            else:
-                checkin_formatted = 'Not recorded'
-            
-            checkin_cell = ws.cell(row=row, column=3, value=checkin_formatted)
-            checkin_cell.font = Font(size=11)
-            checkin_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Check-out time
-            checkout = record.get('checkout', '')
-            if checkout and checkout != '':
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(checkout.replace('Z', '+00:00'))
-                    checkout_formatted = dt.strftime('%H:%M:%S')
-                except:
-                    checkout_formatted = 'Not recorded'
-            else:
-                checkout_formatted = 'Not recorded'
+        # Data rows (only 5 columns, borders only, no background colors)
+        for record in records:
+            # Check-in time (HH:MM:SS sliced from the ISO timestamp)
+            checkin_formatted = _ts_to_hhmmss(record.get('checkin', ''))
             
-            checkout_cell = ws.cell(row=row, column=4, value=checkout_formatted)
-            checkout_cell.font = Font(size=11)
-            checkout_cell.alignment = Alignment(horizontal="center", vertical="center")
+            # Check-out time (HH:MM:SS sliced from the ISO timestamp)
+            checkout_formatted = _ts_to_hhmmss(record.get('checkout', ''))
             
             # Delay time
             delay = record.get('delay', '')
@@ -1513,40 +1883,16 @@ def api_daily_attendance_report_excel():
             else:
                 delay_formatted = '00:00:00'
             
-            delay_cell = ws.cell(row=row, column=5, value=delay_formatted)
-            delay_cell.font = Font(size=11)
-            delay_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Add borders only (no background colors)
-            for col in range(1, 6):  # Only 5 columns
-                cell = ws.cell(row=row, column=col)
-                cell.border = Border(
-                    left=Side(style='thin', color='000000'),
-                    right=Side(style='thin', color='000000'),
-                    top=Side(style='thin', color='000000'),
-                    bottom=Side(style='thin', color='000000')
-                )
-        
-        # Set column widths (only for 5 columns)
-        column_widths = [15, 30, 15, 15, 15]  # Faculty ID, Name, Check-in, Check-out, Delay
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[chr(64 + i)].width = width
-        
-        # Explicitly clear any styling from extra columns
-        for row in range(1, len(records) + 10):
-            for col in range(6, 50):  # Clear columns F onwards
-                cell = ws.cell(row=row, column=col)
-                cell.value = None
-                cell.fill = PatternFill()  # No fill
-                cell.font = Font()  # Default font
-                cell.border = Border()  # No border
-                cell.alignment = Alignment()  # Default alignment
-        
-        # Set the used range to only include columns A-E
-        ws.max_column = 5
+            ws.append([
+                _xl_cell(ws, record.get('student_id', ''), font=_XL_FONT_BOLD, alignment=_XL_CENTER,
+                         border=_XL_BORDER_THIN),
+                _xl_cell(ws, record.get('name', ''), font=_XL_FONT, alignment=_XL_LEFT, border=_XL_BORDER_THIN),
+            ] + [
+                _xl_cell(ws, value, font=_XL_FONT, alignment=_XL_CENTER, border=_XL_BORDER_THIN)
+                for value in (checkin_formatted, checkout_formatted, delay_formatted)
+            ])
         
         # Save to BytesIO
-        from io import BytesIO
         output = BytesIO()
         wb.save(output)
         output.seek(0)
@@ -1558,18 +1904,18 @@ def api_daily_attendance_report_excel():
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export Excel: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export Excel: {str(e)}"})
 
 @app.route("/api/daily-attendance-report/pdf", methods=["GET"])
 def api_daily_attendance_report_pdf():
     """Export daily attendance report as PDF file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         date = request.args.get('date')
         if not date:
-            return jsonify({"success": False, "error": "Date is required"})
+            return _json_response({"success": False, "error": "Date is required"})
         
         print(f"PDF generation requested for date: {date}")
         
@@ -1579,91 +1925,54 @@ def api_daily_attendance_report_pdf():
         
         if not source_file.exists():
             print(f"File not found: {source_file}")
-            return jsonify({"success": False, "error": f"No attendance data found for {date}"})
+            return _json_response({"success": False, "error": f"No attendance data found for {date}"})
         
         print(f"Reading data from: {source_file}")
-        with source_file.open('r', encoding='utf-8') as f:
-            records = json.load(f)
+        records = _load_json_cached(source_file)
         
         print(f"Found {len(records)} records")
         
-        # Calculate delays for all records (same logic as API)
-        if records:
-            try:
-                date_obj = datetime.strptime(date, "%Y-%m-%d")
-                # Group records by faculty ID
-                by_id = {}
-                for row in records:
-                    sid = (row.get('student_id') or '').strip().upper()
-                    if sid:
-                        by_id.setdefault(sid, []).append(row)
-                
-                # Calculate delay for each faculty member
-                for sid, faculty_rows in by_id.items():
-                    staff_type = determine_staff_type(sid)
-                    delay_val = compute_daily_delay_for_records(faculty_rows, date_obj, staff_type)
-                    for r in faculty_rows:
-                        r['delay'] = delay_val
-            except Exception as e:
-                print(f"Error calculating delays: {e}")
-        
-        # Consolidate records by faculty ID (one row per faculty)
-        consolidated_records = {}
-        for record in records:
-            faculty_id = (record.get('student_id') or '').strip().upper()
-            if faculty_id not in consolidated_records:
-                consolidated_records[faculty_id] = {
-                    'student_id': faculty_id,
-                    'name': record.get('name', ''),
-                    'checkins': [],
-                    'checkouts': [],
-                    'delay': record.get('delay', '')
-                }
-            
-            # Collect all check-ins and check-outs
-            checkin = record.get('checkin', '')
-            checkout = record.get('checkout', '')
-            
-            if checkin and checkin != '':
+        # Sort once by faculty ID; each faculty's records are then one contiguous run
+        def faculty_key(row):
+            return (row.get('student_id') or '').strip().upper()
+        records.sort(key=faculty_key)
+        
+        try:
+            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            thresholds = {st: get_threshold_datetimes(date_obj, st) for st in STAFF_TYPES}
+        except Exception as e:
+            print(f"Error calculating delays: {e}")
+            date_obj = None
+        
+        # Consolidate each run into one row per faculty: delay (same logic as API),
+        # earliest check-in and latest check-out
+        consolidated_records = []
+        for faculty_id, group in groupby(records, key=faculty_key):
+            group = list(group)
+            delay = group[0].get('delay', '')
+            if faculty_id and date_obj is not None:
                 try:
-                    dt = datetime.fromisoformat(checkin.replace('Z', '+00:00'))
-                    consolidated_records[faculty_id]['checkins'].append(dt)
-                except:
-                    pass
+                    staff_type = determine_staff_type(faculty_id)
+                    delay = compute_daily_delay_for_records(group, date_obj, staff_type, thresholds[staff_type])
+                except Exception as e:
+                    print(f"Error calculating delays: {e}")
             
-            if checkout and checkout != '':
-                try:
-                    dt = datetime.fromisoformat(checkout.replace('Z', '+00:00'))
-                    consolidated_records[faculty_id]['checkouts'].append(dt)
-                except:
-                    pass
-        
-        # Sort consolidated records by faculty ID
-        sorted_faculty_ids = sorted(consolidated_records.keys())
+            earliest_checkin, latest_checkout = checkin_checkout_bounds(group)
+            consolidated_records.append({
+                'student_id': faculty_id,
+                'name': group[0].get('name', ''),
+                'earliest_checkin': earliest_checkin,
+                'latest_checkout': latest_checkout,
+                'delay': delay
+            })
         
         # Create PDF with same template as monthly report
         print("Starting PDF generation...")
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from io import BytesIO
         
         print("Creating PDF buffer...")
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=16,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        
         # Build content
         story = []
         
@@ -1677,103 +1986,46 @@ def api_daily_attendance_report_pdf():
         formatted_date = f"{date_parts[2]}-{date_parts[1]}-{date_parts[0]}"
         
         # Report title - Two line format
-        report_title_style = ParagraphStyle(
-            'ReportTitle',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=12,
-            alignment=1  # Center alignment
-        )
-        report_title = Paragraph("Faculty Attendance", report_title_style)
+        report_title = Paragraph("Faculty Attendance", _PDF_DAILY_TITLE_STYLE)
         story.append(report_title)
         
         # Date line
-        date_style = ParagraphStyle(
-            'DateStyle',
-            parent=styles['Heading3'],
-            fontSize=12,
-            spaceAfter=20,
-            alignment=1  # Center alignment
-        )
-        date_title = Paragraph(f"Date: {formatted_date}", date_style)
+        date_title = Paragraph(f"Date: {formatted_date}", _PDF_DAILY_DATE_STYLE)
         story.append(date_title)
         story.append(Spacer(1, 20))
         
         # Create table data with consolidated records
-        table_data = [['Faculty ID', 'Name', 'Check In', 'Check Out', 'Delay']]
-        for faculty_id in sorted_faculty_ids:
-            record = consolidated_records[faculty_id]
-            
-            # Format check in time (earliest check-in)
-            if record['checkins']:
-                earliest_checkin = min(record['checkins'])
-                checkin_formatted = earliest_checkin.strftime('%H:%M:%S')
-            else:
-                checkin_formatted = 'Absent'
-            
-            # Format check out time (latest check-out)
-            if record['checkouts']:
-                latest_checkout = max(record['checkouts'])
-                checkout_formatted = latest_checkout.strftime('%H:%M:%S')
-            else:
-                checkout_formatted = 'Absent'
-            
-            # Format delay value with refined logic for check-in without check-out
-            delay = record.get('delay', '')
-            if checkin_formatted == 'Absent':
-                # If no check-in at all, show as Absent
+        def table_row(entry):
+            """Earliest check-in, latest check-out and delay; 'Absent' when a time is missing."""
+            earliest_checkin = entry['earliest_checkin']
+            latest_checkout = entry['latest_checkout']
+            delay = entry['delay']
+            if not earliest_checkin or not latest_checkout:
+                # No check-in at all, or check-in without check-out
                 delay_formatted = 'Absent'
-            elif checkout_formatted == 'Absent':
-                # If has check-in but no check-out, show as Absent
-                delay_formatted = 'Absent'
-            elif delay and delay != '' and delay != 'N/A':
-                # If both check-in and check-out present, show calculated delay
+            elif delay and delay != 'N/A':
+                # Both check-in and check-out present, show calculated delay
                 delay_formatted = delay
             else:
                 # Fallback case - both present but no delay calculated
                 delay_formatted = '00:00:00'
-            
-            table_data.append([
-                record.get('student_id', ''),
-                record.get('name', ''),
-                checkin_formatted,
-                checkout_formatted,
+            return [
+                entry['student_id'],
+                entry['name'],
+                earliest_checkin.strftime('%H:%M:%S') if earliest_checkin else 'Absent',
+                latest_checkout.strftime('%H:%M:%S') if latest_checkout else 'Absent',
                 delay_formatted
-            ])
+            ]
+        
+        table_data = [['Faculty ID', 'Name', 'Check In', 'Check Out', 'Delay']] + [
+            table_row(entry) for entry in consolidated_records
+        ]
         
-        # Create table with professional styling
-        table = Table(table_data, colWidths=[80, 150, 80, 80, 80])
-        table.setStyle(TableStyle([
-            # Header styling - black background with white text (matching monthly report)
-            ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, 0), 'LEFT'),  # Left align headers (matching monthly report)
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),  # Better padding
-            ('TOPPADDING', (0, 0), (-1, 0), 10),
-            # White vertical borders for header (matching monthly report)
-            ('LINEBEFORE', (0, 0), (0, 0), 1.0, colors.white),
-            ('LINEBEFORE', (1, 0), (1, 0), 1.0, colors.white),
-            ('LINEBEFORE', (2, 0), (2, 0), 1.0, colors.white),
-            ('LINEBEFORE', (3, 0), (3, 0), 1.0, colors.white),
-            ('LINEBEFORE', (4, 0), (4, 0), 1.0, colors.white),
-            ('LINEAFTER', (0, 0), (0, 0), 1.0, colors.white),
-            ('LINEAFTER', (1, 0), (1, 0), 1.0, colors.white),
-            ('LINEAFTER', (2, 0), (2, 0), 1.0, colors.white),
-            ('LINEAFTER', (3, 0), (3, 0), 1.0, colors.white),
-            ('LINEAFTER', (4, 0), (4, 0), 1.0, colors.white),
-            # Data row styling - alternating white and light grey (matching monthly report)
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),  # Left align data (matching monthly report)
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 11),  # Larger data font for better readability
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),  # Better padding
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            # Black borders for all cells (matching monthly report)
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.black),  # Clean borders
-        ]))
+        # Create table with professional styling; fixed row heights (header 32pt,
+        # rows 28pt, as the style's fonts and paddings give) skip per-cell measuring
+        table = Table(table_data, colWidths=[80, 150, 80, 80, 80],
+                      rowHeights=[32] + [28] * (len(table_data) - 1))
+        table.setStyle(_DAILY_TABLE_STYLE)
         
         story.append(table)
         
@@ -1795,68 +2047,124 @@ def api_daily_attendance_report_pdf():
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export PDF: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export PDF: {str(e)}"})
 
 
 def detect_holiday_dates(month, year, faculty_details):
     """Detect holiday dates where all faculty have 'Not recorded' for both check-in and check-out."""
-    from calendar import monthrange
     days_in_month = monthrange(int(year), int(month))[1]
+    mm = month.zfill(2)
     holiday_dates = []
+    source_dir = get_attendance_dir()
+    wanted_ids = {faculty_id.upper() for faculty_id in faculty_details}
     
     for day in range(1, days_in_month + 1):
+        date_str = f"{year}-{mm}-{day:02d}"
+        source_file = source_dir / f"{date_str}.json"
+        
+        if not source_file.exists():
+            # No file exists for this date - consider it a holiday
+            holiday_dates.append(date_str)
+            continue
+        
         try:
-            date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            
-            source_dir = get_attendance_dir()
-            source_file = source_dir / f"{date_str}.json"
-            
-            if not source_file.exists():
-                # No file exists for this date - consider it a holiday
-                holiday_dates.append(date_str)
+            records = _load_json_cached(source_file, copy=False)
+        except JSON_READ_ERRORS:
+            continue  # unreadable file: neither holiday nor working day
+        
+        # Check if ALL faculty have 'Not recorded' for both check-in and check-out,
+        # in one pass over the day's records
+        all_faculty_absent = True
+        
+        for record in records:
+            if (record.get('student_id') or '').strip().upper() not in wanted_ids:
                 continue
-            
-            with source_file.open('r', encoding='utf-8') as f:
-                records = json.load(f)
-            
-            # Check if ALL faculty have 'Not recorded' for both check-in and check-out
-            all_faculty_absent = True
-            
-            for faculty_id in faculty_details.keys():
-                faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                
-                if faculty_records:
-                    # Check if this faculty has any valid check-in or check-out
-                    has_valid_time = False
-                    for record in faculty_records:
-                        checkin = record.get('checkin', '').strip()
-                        checkout = record.get('checkout', '').strip()
-                        
-                        if checkin and checkin != '' and checkin != 'Not recorded':
-                            has_valid_time = True
-                            break
-                        if checkout and checkout != '' and checkout != 'Not recorded':
-                            has_valid_time = True
-                            break
-                    
-                    if has_valid_time:
-                        all_faculty_absent = False
-                        break
-                else:
-                    # No records for this faculty - they are absent
-                    continue
-            
-            if all_faculty_absent:
-                holiday_dates.append(date_str)
-                
-        except ValueError:
-            # Invalid date, skip
-            continue
+            checkin = (record.get('checkin') or '').strip()
+            checkout = (record.get('checkout') or '').strip()
+            if (checkin and checkin != 'Not recorded') or (checkout and checkout != 'Not recorded'):
+                all_faculty_absent = False
+                break
+        
+        if all_faculty_absent:
+            holiday_dates.append(date_str)
     
     return holiday_dates
 
 
+def month_working_days(month: str, year: str, holiday_dates: List[str]) -> List[Tuple[int, str, datetime]]:
+    """(day, YYYY-MM-DD, date) for every non-holiday day of the month, in order."""
+    y, m = int(year), int(month)
+    mm = month.zfill(2)
+    holidays = set(holiday_dates)
+    working_days = []
+    for day in range(1, monthrange(y, m)[1] + 1):
+        date_str = f"{year}-{mm}-{day:02d}"
+        if date_str not in holidays:
+            working_days.append((day, date_str, datetime(y, m, day)))
+    return working_days
+
+
+def index_month_records(month: str, year: str) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Read each day file of the month once, grouping its records by upper-cased faculty ID.
+    Keyed by YYYY-MM-DD; days without a readable file map to an empty dict.
+    """
+    days_in_month = monthrange(int(year), int(month))[1]
+    mm = month.zfill(2)
+    source_dir = get_attendance_dir()
+    month_records = {}
+    
+    for day in range(1, days_in_month + 1):
+        date_str = f"{year}-{mm}-{day:02d}"
+        source_file = source_dir / f"{date_str}.json"
+        by_faculty = defaultdict(list)
+        if source_file.exists():
+            try:
+                records = _load_json_cached(source_file, copy=False)
+            except JSON_READ_ERRORS:
+                records = []
+            for record in records:
+                by_faculty[(record.get('student_id') or '').strip().upper()].append(record)
+        month_records[date_str] = dict(by_faculty)
+    
+    return month_records
+
+
+# Generated detailed-report files (Excel/PDF bytes), most recently used last
+REPORT_CACHE_SIZE = 16
+_report_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+def _report_cache_key(kind: str, month: str, year: str, faculty: str) -> Tuple[Any, ...] | None:
+    """Cache key for a generated report: the request plus the (mtime_ns, size) of
+    every day file in the month and of faculty_detail.json, so any edit or new
+    sync yields a new key. None (not cacheable) for a non-numeric month/year.
+    """
+    if not (month.isdigit() and year.isdigit()):
+        return None
+    source_dir = get_attendance_dir()
+    stamps = _month_file_stamps(source_dir, month, year)
+    return (kind, month.zfill(2), year, faculty, str(source_dir),
+            tuple((date_str, tuple(stamp)) for date_str, stamp in stamps.items()),
+            _faculty_file_stamp())
+
+def _get_cached_report(key: Tuple[Any, ...] | None) -> bytes | None:
+    if key is None:
+        return None
+    with _report_cache_lock:
+        content = _report_cache.get(key)
+        if content is not None:
+            _report_cache.move_to_end(key)
+        return content
+
+def _store_cached_report(key: Tuple[Any, ...] | None, content: bytes) -> None:
+    if key is None:
+        return
+    with _report_cache_lock:
+        _report_cache[key] = content
+        while len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+
+
 @app.route("/faculty-detailed-report")
 def faculty_detailed_report_page():
     """Serve the faculty detailed report webpage."""
@@ -1869,7 +2177,7 @@ def faculty_detailed_report_page():
 def api_faculty_detailed_report():
     """Get faculty detailed report data."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         month = request.args.get('month')
@@ -1877,7 +2185,7 @@ def api_faculty_detailed_report():
         faculty = request.args.get('faculty')
         
         if not month or not year or not faculty:
-            return jsonify({"success": False, "error": "Month, year, and faculty are required"})
+            return _json_response({"success": False, "error": "Month, year, and faculty are required"})
         
         # Get faculty details
         faculty_details = load_faculty_details()
@@ -1888,12 +2196,11 @@ def api_faculty_detailed_report():
         else:
             target_faculty = [faculty]
         
-        # Get all days in the month
-        from calendar import monthrange
-        days_in_month = monthrange(int(year), int(month))[1]
-        
-        # Detect holiday dates
+        # Detect holiday dates; every faculty below walks the remaining days
         holiday_dates = detect_holiday_dates(month, year, faculty_details)
+        working_days = month_working_days(month, year, holiday_dates)
+        # Each day file read once and grouped by faculty, shared by all faculty below
+        month_records = index_month_records(month, year)
         
         # Collect data for each faculty member
         faculty_reports = []
@@ -1901,91 +2208,46 @@ def api_faculty_detailed_report():
         for faculty_id in target_faculty:
             faculty_info = faculty_details.get(faculty_id, {})
             faculty_name = faculty_info.get('name', '')
+            faculty_key = faculty_id.upper()
+            staff_type = determine_staff_type(faculty_id)  # same for every day of the month
             
             # Collect daily data for this faculty
             daily_data = []
             total_delay_seconds = 0
             absent_count = 0
             
-            for day in range(1, days_in_month + 1):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    # Skip holiday dates
-                    if date_str in holiday_dates:
-                        continue
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    day_data = {
-                        'date': date_str,
-                        'checkin': 'Not recorded',
-                        'checkout': 'Not recorded',
-                        'delay': '00:00:00'
-                    }
-                    
-                    # Initialize checkins and checkouts lists
-                    checkins = []
-                    checkouts = []
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                        
-                        if faculty_records:
-                            # Find earliest check-in and latest check-out
-                            
-                            for record in faculty_records:
-                                ci = parse_ts(record.get('checkin'))
-                                co = parse_ts(record.get('checkout'))
-                                if ci:
-                                    checkins.append(ci)
-                                if co:
-                                    checkouts.append(co)
-                            
-                            if checkins:
-                                earliest_checkin = min(checkins)
-                                day_data['checkin'] = earliest_checkin.strftime('%H:%M:%S')
-                            
-                            if checkouts:
-                                latest_checkout = max(checkouts)
-                                day_data['checkout'] = latest_checkout.strftime('%H:%M:%S')
-                    
-                    # Calculate delay
-                    staff_type = determine_staff_type(faculty_id)
-                    delay_val = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                    
-                    # Check if both check-in and check-out are not recorded
-                    if not checkins and not checkouts:
-                        day_data['delay'] = 'Absent'
-                        absent_count += 1
-                    else:
-                        day_data['delay'] = delay_val
-                    
-                    # Add to total delay
-                    if delay_val and delay_val != 'N/A' and day_data['delay'] != 'Absent':
-                        try:
-                            delay_parts = delay_val.split(':')
-                            if len(delay_parts) == 3:
-                                hours, minutes, seconds = map(int, delay_parts)
-                                total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                        except:
-                            pass
-                    
-                    daily_data.append(day_data)
-                    
-                except ValueError:
-                    # Invalid date, skip
-                    daily_data.append({
-                        'date': f"{year}-{month.zfill(2)}-{day:02d}",
-                        'checkin': 'Invalid Date',
-                        'checkout': 'Invalid Date',
-                        'delay': '00:00:00'
-                    })
+            for _, date_str, date_obj in working_days:
+                day_data = {
+                    'date': date_str,
+                    'checkin': 'Not recorded',
+                    'checkout': 'Not recorded',
+                    'delay': '00:00:00'
+                }
+                
+                # Earliest check-in and latest check-out
+                faculty_records = month_records[date_str].get(faculty_key, [])
+                earliest_checkin, latest_checkout = checkin_checkout_bounds(faculty_records)
+                if earliest_checkin:
+                    day_data['checkin'] = earliest_checkin.strftime('%H:%M:%S')
+                if latest_checkout:
+                    day_data['checkout'] = latest_checkout.strftime('%H:%M:%S')
+                
+                # Calculate delay
+                delay_seconds = delay_seconds_for_bounds(earliest_checkin, latest_checkout, date_obj, staff_type)
+                delay_val = _seconds_to_hhmmss(delay_seconds)
+                
+                # Check if both check-in and check-out are not recorded
+                if not earliest_checkin and not latest_checkout:
+                    day_data['delay'] = 'Absent'
+                    absent_count += 1
+                else:
+                    day_data['delay'] = delay_val
+                
+                # Add to total delay
+                if day_data['delay'] != 'Absent':
+                    total_delay_seconds += delay_seconds
+                
+                daily_data.append(day_data)
             
             faculty_reports.append({
                 'faculty_id': faculty_id,
@@ -1995,7 +2257,7 @@ def api_faculty_detailed_report():
                 'absent_count': absent_count
             })
         
-        return jsonify({
+        return _json_response({
             "success": True,
             "data": faculty_reports,
             "month": month,
@@ -2004,14 +2266,14 @@ def api_faculty_detailed_report():
         })
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to get faculty detailed report: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to get faculty detailed report: {str(e)}"})
 
 
 @app.route("/api/faculty-detailed-report/excel", methods=["GET"])
 def api_faculty_detailed_report_excel():
     """Export faculty detailed report as Excel file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         month = request.args.get('month')
@@ -2019,7 +2281,19 @@ def api_faculty_detailed_report_excel():
         faculty = request.args.get('faculty')
         
         if not month or not year or not faculty:
-            return jsonify({"success": False, "error": "Month, year, and faculty are required"})
+            return _json_response({"success": False, "error": "Month, year, and faculty are required"})
+        
+        filename = f'faculty_detailed_report_{faculty}_{year}_{month}.xlsx'
+        # Reuse the last file built from the same day files and faculty data
+        # (stamped before reading, so a concurrent edit is never cached as current)
+        cache_key = _report_cache_key('excel', month, year, faculty)
+        content = _get_cached_report(cache_key)
+        if content is not None:
+            return app.response_class(
+                content,
+                mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                headers={'Content-Disposition': f'attachment; filename={filename}'}
+            )
         
         # Get faculty details
         faculty_details = load_faculty_details()
@@ -2030,238 +2304,140 @@ def api_faculty_detailed_report_excel():
         else:
             target_faculty = [faculty]
         
-        # Get all days in the month
-        from calendar import monthrange
-        days_in_month = monthrange(int(year), int(month))[1]
+        mm = month.zfill(2)
         
-        # Detect holiday dates
+        # Detect holiday dates; every faculty below walks the remaining days
         holiday_dates = detect_holiday_dates(month, year, faculty_details)
+        working_days = month_working_days(month, year, holiday_dates)
+        # Each day file read once and grouped by faculty, shared by all faculty below
+        month_records = index_month_records(month, year)
         
-        # Create Excel workbook
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from openpyxl.utils import get_column_letter
-        
-        wb = Workbook()
+        # Create Excel workbook (write-only: rows are streamed, not kept as cells)
+        wb = new_xl_workbook()
         
         # Convert month number to month name
-        month_names = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        month_name = month_names.get(month.zfill(2), month)
+        month_name = MONTH_NAMES.get(month.zfill(2), month)
+        
+        # Column widths - optimized for better readability
+        column_widths = [20, 22, 22, 18]  # Date, Check In, Check Out, Delay (increased for better fit)
+        
+        def new_sheet(title):
+            """Sheet with column widths and the report heading already written."""
+            sheet = wb.create_sheet(title=title)
+            # Write-only sheets need widths/heights before the first row is appended
+            _xl_set_widths(sheet, column_widths)
+            sheet.row_dimensions[1].height = 25
+            sheet.append([_xl_cell(sheet, f"DETAILED FACULTY REPORT - {month_name}",
+                                   font=_XL_FONT_HEADING, alignment=_XL_CENTER)])
+            sheet.merged_cells.add('A1:D1')  # Merge across all columns
+            return sheet
         
         # Handle single faculty vs all faculty differently
-        if faculty == 'all':
-            # Remove default sheet for multiple sheets
-            wb.remove(wb.active)
-        else:
+        if faculty != 'all':
             # Use single sheet for individual faculty
-            ws = wb.active
-            ws.title = f"Faculty Report {month}-{year}"
-            
-            # Add top heading for the entire report (single faculty)
-            top_heading = ws.cell(row=1, column=1, value=f"DETAILED FACULTY REPORT - {month_name}")
-            top_heading.font = Font(bold=True, size=16, color="000000")
-            top_heading.alignment = Alignment(horizontal="center", vertical="center")
-            ws.merge_cells(f'A1:D1')  # Merge across all columns
-            ws.row_dimensions[1].height = 25
+            ws = new_sheet(f"Faculty Report {month}-{year}")
         
         # Process each faculty member
         for faculty_id in target_faculty:
             # Create a new sheet for each faculty when "all" is selected
             if faculty == 'all':
-                ws = wb.create_sheet(title=faculty_id)
-                current_row = 1
-                
-                # Add top heading for this faculty's sheet
-                top_heading = ws.cell(row=current_row, column=1, value=f"DETAILED FACULTY REPORT - {month_name}")
-                top_heading.font = Font(bold=True, size=16, color="000000")
-                top_heading.alignment = Alignment(horizontal="center", vertical="center")
-                ws.merge_cells(f'A{current_row}:D{current_row}')
-                ws.row_dimensions[current_row].height = 25
-                current_row += 1
-            else:
-                current_row = 2
+                ws = new_sheet(faculty_id)
             faculty_info = faculty_details.get(faculty_id, {})
             faculty_name = faculty_info.get('name', '')
+            faculty_key = faculty_id.upper()
+            staff_type = determine_staff_type(faculty_id)  # same for every day of the month
             
             # Faculty header - Blue text format like second image
-            faculty_header = ws.cell(row=current_row, column=1, value=f"{faculty_id} - {faculty_name}")
-            faculty_header.font = Font(bold=True, size=14, color="0000FF")  # Blue text
-            faculty_header.alignment = Alignment(horizontal="left", vertical="center")
-            current_row += 1
+            ws.append([_xl_cell(ws, f"{faculty_id} - {faculty_name}", font=_XL_FONT_FACULTY, alignment=_XL_LEFT)])
             
             # Create date-wise table for this faculty
             # Headers: Date, Check In Time, Check Out Time, Delay
             headers = ['Date', 'Check In Time', 'Check Out Time', 'Delay']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=current_row, column=col, value=header)
-                cell.font = Font(bold=True, color="FFFFFF", size=12)
-                cell.fill = PatternFill(start_color="000000", end_color="000000", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-                
-                # Add white borders for better column identification
-                cell.border = Border(
-                    left=Side(style='medium', color='FFFFFF'),  # White left border
-                    right=Side(style='medium', color='FFFFFF'),  # White right border
-                    top=Side(style='medium', color='000000'),
-                    bottom=Side(style='medium', color='000000')
-                )
-            current_row += 1
+            ws.append([_xl_cell(ws, header, font=_XL_FONT_HEADER, fill=_xl_fill("000000"),
+                                alignment=_XL_CENTER, border=_XL_BORDER_HEADER) for header in headers])
             
             # Collect daily data for this faculty
             total_delay_seconds = 0
             absent_count = 0
             
-            for day in range(1, days_in_month + 1):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    # Skip holiday dates
-                    if date_str in holiday_dates:
-                        continue
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    checkin = 'Not recorded'
-                    checkout = 'Not recorded'
-                    delay = '00:00:00'
-                    
-                    # Initialize checkins and checkouts lists
-                    checkins = []
-                    checkouts = []
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
-                        
-                        if faculty_records:
-                            # Find earliest check-in and latest check-out
-                            
-                            for record in faculty_records:
-                                ci = parse_ts(record.get('checkin'))
-                                co = parse_ts(record.get('checkout'))
-                                if ci:
-                                    checkins.append(ci)
-                                if co:
-                                    checkouts.append(co)
-                            
-                            if checkins:
-                                earliest_checkin = min(checkins)
-                                checkin = earliest_checkin.strftime('%H:%M:%S')
-                            
-                            if checkouts:
-                                latest_checkout = max(checkouts)
-                                checkout = latest_checkout.strftime('%H:%M:%S')
-                            
-                            # Calculate delay
-                    staff_type = determine_staff_type(faculty_id)
-                    delay_val = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                    
-                    # Check if both check-in and check-out are not recorded
-                    if not checkins and not checkouts:
-                        delay = 'Absent'
-                        absent_count += 1
-                    else:
-                        delay = delay_val
-                            
-                    # Add to total delay
-                    if delay_val and delay_val != 'N/A' and delay != 'Absent':
-                        try:
-                            delay_parts = delay_val.split(':')
-                            if len(delay_parts) == 3:
-                                hours, minutes, seconds = map(int, delay_parts)
-                                total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                        except:
-                            pass
-                    
-                    # Add row data
-                    row_data = [
-                        f"{day:02d}/{month.zfill(2)}/{year}",
-                        checkin,
-                        checkout,
-                        delay
-                    ]
-                    
-                    for col, value in enumerate(row_data, 1):
-                        cell = ws.cell(row=current_row, column=col, value=value)
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                        cell.border = Border(
-                            left=Side(style='thin', color='000000'),
-                            right=Side(style='thin', color='000000'),
-                            top=Side(style='thin', color='000000'),
-                            bottom=Side(style='thin', color='000000')
-                        )
+            for day, date_str, date_obj in working_days:
+                checkin = 'Not recorded'
+                checkout = 'Not recorded'
+                delay = '00:00:00'
+                
+                # Earliest check-in and latest check-out
+                faculty_records = month_records[date_str].get(faculty_key, [])
+                earliest_checkin, latest_checkout = checkin_checkout_bounds(faculty_records)
+                if earliest_checkin:
+                    checkin = earliest_checkin.strftime('%H:%M:%S')
+                if latest_checkout:
+                    checkout = latest_checkout.strftime('%H:%M:%S')
+                
+                # Calculate delay
+                delay_seconds = delay_seconds_for_bounds(earliest_checkin, latest_checkout, date_obj, staff_type)
+                delay_val = _seconds_to_hhmmss(delay_seconds)
+                
+                # Check if both check-in and check-out are not recorded
+                if not earliest_checkin and not latest_checkout:
+                    delay = 'Absent'
+                    absent_count += 1
+                else:
+                    delay = delay_val
                         
-                        # Apply red text for "Absent" delay
-                        if col == 4 and value == 'Absent':  # Delay column
-                            cell.font = Font(color="FF0000", bold=True)  # Red text
-                    
-                    current_row += 1
-                    
-                except ValueError:
-                    # Invalid date, skip
-                    pass
-            
-            # Add total delay and absent count rows
-            total_delay_cell = ws.cell(row=current_row, column=1, value="Total Delay")
-            total_delay_cell.font = Font(bold=True, size=12)
-            total_delay_cell.fill = PatternFill(start_color="F0F8FF", end_color="F0F8FF", fill_type="solid")
-            total_delay_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            total_delay_value = ws.cell(row=current_row, column=4, value=_seconds_to_hhmmss(total_delay_seconds))
-            total_delay_value.font = Font(bold=True, size=12)
-            total_delay_value.fill = PatternFill(start_color="F0F8FF", end_color="F0F8FF", fill_type="solid")
-            total_delay_value.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Add absent count row
-            current_row += 1
-            absent_count_cell = ws.cell(row=current_row, column=1, value="Absent Count")
-            absent_count_cell.font = Font(bold=True, size=12)
-            absent_count_cell.fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-            absent_count_cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            absent_count_value = ws.cell(row=current_row, column=4, value=absent_count)
-            absent_count_value.font = Font(bold=True, size=12)
-            absent_count_value.fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-            absent_count_value.alignment = Alignment(horizontal="center", vertical="center")
+                # Add to total delay
+                if delay != 'Absent':
+                    total_delay_seconds += delay_seconds
+                
+                # Add row data
+                row_data = [
+                    f"{day:02d}/{mm}/{year}",
+                    checkin,
+                    checkout,
+                    delay
+                ]
+                
+                row_cells = [_xl_cell(ws, value, alignment=_XL_CENTER, border=_XL_BORDER_THIN) for value in row_data]
+                
+                # Apply red text for "Absent" delay
+                if delay == 'Absent':  # Delay column
+                    row_cells[3].font = _XL_FONT_ABSENT
+                
+                ws.append(row_cells)
             
-            current_row += 2  # Add spacing between faculty members
-        
-        # Set column widths - optimized for better readability
-        # Apply to all sheets in the workbook
-        column_widths = [20, 22, 22, 18]  # Date, Check In, Check Out, Delay (increased for better fit)
-        for sheet in wb.worksheets:
-            for i, width in enumerate(column_widths, 1):
-                sheet.column_dimensions[chr(64 + i)].width = width
+            # Add total delay and absent count rows (label in the first column, value in the last)
+            ws.append([
+                _xl_cell(ws, "Total Delay", font=_XL_FONT_BOLD_12, fill=_xl_fill("F0F8FF"), alignment=_XL_CENTER),
+                None, None,
+                _xl_cell(ws, _seconds_to_hhmmss(total_delay_seconds), font=_XL_FONT_BOLD_12,
+                         fill=_xl_fill("F0F8FF"), alignment=_XL_CENTER),
+            ])
+            ws.append([
+                _xl_cell(ws, "Absent Count", font=_XL_FONT_BOLD_12, fill=_xl_fill("FFE6E6"), alignment=_XL_CENTER),
+                None, None,
+                _xl_cell(ws, absent_count, font=_XL_FONT_BOLD_12, fill=_xl_fill("FFE6E6"), alignment=_XL_CENTER),
+            ])
         
         # Save to BytesIO
-        from io import BytesIO
         output = BytesIO()
         wb.save(output)
-        output.seek(0)
+        content = output.getvalue()
+        _store_cached_report(cache_key, content)
         
         return app.response_class(
-            output.getvalue(),
+            content,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={'Content-Disposition': f'attachment; filename=faculty_detailed_report_{faculty}_{year}_{month}.xlsx'}
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export Excel: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export Excel: {str(e)}"})
 
 
 @app.route("/api/faculty-detailed-report/pdf", methods=["GET"])
 def api_faculty_detailed_report_pdf():
     """Export faculty detailed report as PDF file."""
     if not is_logged_in():
-        return jsonify({"success": False, "error": "Not authenticated"}), 401
+        return _json_response({"success": False, "error": "Not authenticated"}, 401)
     
     try:
         month = request.args.get('month')
@@ -2269,7 +2445,19 @@ def api_faculty_detailed_report_pdf():
         faculty = request.args.get('faculty')
         
         if not month or not year or not faculty:
-            return jsonify({"success": False, "error": "Month, year, and faculty are required"})
+            return _json_response({"success": False, "error": "Month, year, and faculty are required"})
+        
+        filename = f'faculty_detailed_report_{faculty}_{year}_{month}.pdf'
+        # Reuse the last file built from the same day files and faculty data
+        # (stamped before reading, so a concurrent edit is never cached as current)
+        cache_key = _report_cache_key('pdf', month, year, faculty)
+        content = _get_cached_report(cache_key)
+        if content is not None:
+            return app.response_class(
+                content,
+                mimetype='application/pdf',
+                headers={'Content-Disposition': f'attachment; filename={filename}'}
+            )
         
         # Get faculty details
         faculty_details = load_faculty_details()
@@ -2280,27 +2468,18 @@ def api_faculty_detailed_report_pdf():
         else:
             target_faculty = [faculty]
         
-        # Get all days in the month
-        from calendar import monthrange
-        days_in_month = monthrange(int(year), int(month))[1]
+        mm = month.zfill(2)
         
-        # Detect holiday dates
+        # Detect holiday dates; every faculty below walks the remaining days
         holiday_dates = detect_holiday_dates(month, year, faculty_details)
+        working_days = month_working_days(month, year, holiday_dates)
+        # Each day file read once and grouped by faculty, shared by all faculty below
+        month_records = index_month_records(month, year)
         
         # Create PDF
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib import colors
-        from reportlab.lib.units import inch
-        from io import BytesIO
-        
         buffer = BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        
         # Build content
         story = []
         
@@ -2310,22 +2489,10 @@ def api_faculty_detailed_report_pdf():
         story.append(Spacer(1, 20))
         
         # Convert month number to month name
-        month_names = {
-            '01': 'January', '02': 'February', '03': 'March', '04': 'April',
-            '05': 'May', '06': 'June', '07': 'July', '08': 'August',
-            '09': 'September', '10': 'October', '11': 'November', '12': 'December'
-        }
-        month_name = month_names.get(month.zfill(2), month)
+        month_name = MONTH_NAMES.get(month.zfill(2), month)
         
         # Report title - Updated to match Excel format
-        report_title_style = ParagraphStyle(
-            'ReportTitle',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            alignment=1  # Center alignment
-        )
-        report_title = Paragraph(f"DETAILED FACULTY REPORT - {month_name}", report_title_style)
+        report_title = Paragraph(f"DETAILED FACULTY REPORT - {month_name}", _PDF_DETAILED_TITLE_STYLE)
         story.append(report_title)
         story.append(Spacer(1, 20))
         
@@ -2333,121 +2500,56 @@ def api_faculty_detailed_report_pdf():
         for faculty_id in target_faculty:
             faculty_info = faculty_details.get(faculty_id, {})
             faculty_name = faculty_info.get('name', '')
+            faculty_key = faculty_id.upper()
+            staff_type = determine_staff_type(faculty_id)  # same for every day of the month
             
             # Faculty header - Blue text format like second image
-            faculty_header_style = ParagraphStyle(
-                'FacultyHeader',
-                parent=styles['Heading3'],
-                fontSize=14,
-                spaceAfter=10,
-                textColor=colors.blue,  # Blue color like Excel
-                fontName='Helvetica-Bold'
-            )
-            faculty_header = Paragraph(f"{faculty_id} - {faculty_name}", faculty_header_style)
+            faculty_header = Paragraph(f"{faculty_id} - {faculty_name}", _PDF_FACULTY_HEADER_STYLE)
             story.append(faculty_header)
             
             # Create table data for this faculty
             table_data = [['Date', 'Check In Time', 'Check Out Time', 'Delay']]
             total_delay_seconds = 0
             absent_count = 0
+            absent_rows = []
             
-            for day in range(1, days_in_month + 1):
-                try:
-                    date_str = f"{year}-{month.zfill(2)}-{day:02d}"
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    
-                    # Skip holiday dates
-                    if date_str in holiday_dates:
-                        continue
-                    
-                    source_dir = get_attendance_dir()
-                    source_file = source_dir / f"{date_str}.json"
-                    
-                    checkin = 'Not recorded'
-                    checkout = 'Not recorded'
-                    delay = '00:00:00'
-                    
-                    # Initialize checkins and checkouts lists
-                    checkins = []
-                    checkouts = []
-                    
-                    if source_file.exists():
-                        with source_file.open('r', encoding='utf-8') as f:
-                            records = json.load(f)
-                        
-                        faculty_records = [r for r in records if r.get('student_id', '').strip().upper() == faculty_id.upper()]
+            for day, date_str, date_obj in working_days:
+                checkin = 'Not recorded'
+                checkout = 'Not recorded'
+                delay = '00:00:00'
+                
+                # Earliest check-in and latest check-out
+                faculty_records = month_records[date_str].get(faculty_key, [])
+                earliest_checkin, latest_checkout = checkin_checkout_bounds(faculty_records)
+                if earliest_checkin:
+                    checkin = earliest_checkin.strftime('%H:%M:%S')
+                if latest_checkout:
+                    checkout = latest_checkout.strftime('%H:%M:%S')
+                
+                # Calculate delay
+                delay_seconds = delay_seconds_for_bounds(earliest_checkin, latest_checkout, date_obj, staff_type)
+                delay_val = _seconds_to_hhmmss(delay_seconds)
+                
+                # Check if both check-in and check-out are not recorded
+                if not earliest_checkin and not latest_checkout:
+                    delay = 'Absent'
+                    absent_count += 1
+                else:
+                    delay = delay_val
                         
-                        if faculty_records:
-                            # Find earliest check-in and latest check-out
-                            
-                            for record in faculty_records:
-                                ci = parse_ts(record.get('checkin'))
-                                co = parse_ts(record.get('checkout'))
-                                if ci:
-                                    checkins.append(ci)
-                                if co:
-                                    checkouts.append(co)
-                            
-                            if checkins:
-                                earliest_checkin = min(checkins)
-                                checkin = earliest_checkin.strftime('%H:%M:%S')
-                            
-                            if checkouts:
-                                latest_checkout = max(checkouts)
-                                checkout = latest_checkout.strftime('%H:%M:%S')
-                            
-                            # Calculate delay
-                    staff_type = determine_staff_type(faculty_id)
-                    delay_val = compute_daily_delay_for_records(faculty_records, date_obj, staff_type)
-                    
-                    # Check if both check-in and check-out are not recorded
-                    if not checkins and not checkouts:
-                        delay = 'Absent'
-                        absent_count += 1
-                    else:
-                        delay = delay_val
-                            
-                    # Add to total delay
-                    if delay_val and delay_val != 'N/A' and delay != 'Absent':
-                        try:
-                            delay_parts = delay_val.split(':')
-                            if len(delay_parts) == 3:
-                                hours, minutes, seconds = map(int, delay_parts)
-                                total_delay_seconds += hours * 3600 + minutes * 60 + seconds
-                        except:
-                            pass
-                    
-                    # Add row data with special formatting for "Absent"
-                    if delay == 'Absent':
-                        # Use colored text for "Absent"
-                        from reportlab.platypus import Paragraph
-                        from reportlab.lib.styles import ParagraphStyle
-                        absent_style = ParagraphStyle(
-                            'AbsentStyle',
-                            parent=styles['Normal'],
-                            fontSize=10,
-                            textColor=colors.red,
-                            fontName='Helvetica-Bold',
-                            alignment=1  # Center alignment
-                        )
-                        delay_para = Paragraph('<font color="red">Absent</font>', absent_style)
-                        table_data.append([
-                            f"{day:02d}/{month.zfill(2)}/{year}",
-                            checkin,
-                            checkout,
-                            delay_para
-                        ])
-                    else:
-                        table_data.append([
-                            f"{day:02d}/{month.zfill(2)}/{year}",
-                            checkin,
-                            checkout,
-                            delay
-                        ])
-                    
-                except ValueError:
-                    # Invalid date, skip
-                    pass
+                # Add to total delay
+                if delay != 'Absent':
+                    total_delay_seconds += delay_seconds
+                
+                # Add row data; "Absent" is coloured through a per-cell style command
+                if delay == 'Absent':
+                    absent_rows.append(len(table_data))
+                table_data.append([
+                    f"{day:02d}/{mm}/{year}",
+                    checkin,
+                    checkout,
+                    delay
+                ])
             
             # Add total delay and absent count rows
             table_data.append(['Total Delay', '', '', _seconds_to_hhmmss(total_delay_seconds)])
@@ -2455,54 +2557,17 @@ def api_faculty_detailed_report_pdf():
             
             # Create table with optimized A4 width (595 points total)
             # Date: 120, Check In: 150, Check Out: 150, Delay: 120 = 540 points (leaving margins)
-            # repeatRows=1 ensures header is repeated on each page
-            table = Table(table_data, colWidths=[120, 150, 150, 120], repeatRows=1)
-            table.setStyle(TableStyle([
-                # Header styling with white borders (applies to all header rows including repeated ones)
-                ('BACKGROUND', (0, 0), (-1, 0), colors.black),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('TOPPADDING', (0, 0), (-1, 0), 12),
-                ('LEFTPADDING', (0, 0), (-1, 0), 8),
-                ('RIGHTPADDING', (0, 0), (-1, 0), 8),
-                # White borders for header columns
-                ('LINEBEFORE', (0, 0), (0, 0), 2, colors.white),
-                ('LINEAFTER', (0, 0), (0, 0), 2, colors.white),
-                ('LINEBEFORE', (1, 0), (1, 0), 2, colors.white),
-                ('LINEAFTER', (1, 0), (1, 0), 2, colors.white),
-                ('LINEBEFORE', (2, 0), (2, 0), 2, colors.white),
-                ('LINEAFTER', (2, 0), (2, 0), 2, colors.white),
-                ('LINEBEFORE', (3, 0), (3, 0), 2, colors.white),
-                ('LINEAFTER', (3, 0), (3, 0), 2, colors.white),
-                # Data row styling
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 11),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
-                ('TOPPADDING', (0, 1), (-1, -1), 10),
-                ('LEFTPADDING', (0, 1), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 1), (-1, -1), 8),
-                # Column alignment - Date left, Times and Delay center
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),   # Date column - left aligned
-                ('ALIGN', (1, 1), (2, -1), 'CENTER'), # Time columns - center aligned
-                ('ALIGN', (3, 1), (3, -1), 'CENTER'), # Delay column - center aligned
-                # Borders
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                # Total row styling - center aligned
-                ('BACKGROUND', (0, -2), (-1, -2), colors.lightblue),  # Total Delay row
-                ('FONTNAME', (0, -2), (-1, -2), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -2), (-1, -2), 11),
-                ('ALIGN', (0, -2), (-1, -2), 'CENTER'),
-                # Absent count row styling - light red background
-                ('BACKGROUND', (0, -1), (-1, -1), colors.lightcoral),  # Absent Count row
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, -1), (-1, -1), 11),
-                ('ALIGN', (0, -1), (-1, -1), 'CENTER'),
-            ]))
+            # repeatRows=1 ensures header is repeated on each page; fixed row heights
+            # (header 36pt, rows 32pt, as the style's fonts and paddings give) skip per-cell measuring
+            table = LongTable(table_data, colWidths=[120, 150, 150, 120],
+                              rowHeights=[36] + [32] * (len(table_data) - 1), repeatRows=1)
+            table.setStyle(_DETAILED_TABLE_STYLE)
+            if absent_rows:
+                table.setStyle([cmd for row in absent_rows for cmd in (
+                    ('TEXTCOLOR', (3, row), (3, row), colors.red),
+                    ('FONTNAME', (3, row), (3, row), 'Helvetica-Bold'),
+                    ('FONTSIZE', (3, row), (3, row), 10),
+                )])
             
             story.append(table)
             story.append(Spacer(1, 20))
@@ -2513,16 +2578,17 @@ def api_faculty_detailed_report_pdf():
         
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
+        content = buffer.getvalue()
+        _store_cached_report(cache_key, content)
         
         return app.response_class(
-            buffer.getvalue(),
+            content,
             mimetype='application/pdf',
-            headers={'Content-Disposition': f'attachment; filename=faculty_detailed_report_{faculty}_{year}_{month}.pdf'}
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
         
     except Exception as e:
-        return jsonify({"success": False, "error": f"Failed to export PDF: {str(e)}"})
+        return _json_response({"success": False, "error": f"Failed to export PDF: {str(e)}"})
 
 
 if __name__ == "__main__":
@@ -7,6 +7,12 @@ EXCEL_PATH = r"C:\Users\Lenovo\Downloads\faculty_data.xlsx"   # <-- change this
 OUTPUT_JSON_PATH = r"E:\attendence_filter\flask_app\JSON\\faculty_detail.json"  # <-- change output location
 # ==================================
 
+def _text_column(df, column):
+    # Whole column as stripped strings (same text as str(value).strip() per cell); "" if missing
+    if column not in df.columns:
+        return [""] * len(df)
+    return df[column].astype(str).str.strip().tolist()
+
 def process_faculty_excel(excel_path):
     # Read both sheets
     sheets = pd.read_excel(excel_path, sheet_name=None)
@@ -15,25 +21,34 @@ def process_faculty_excel(excel_path):
     for sheet_name, df in sheets.items():
         # Normalize column names
         df.columns = [str(col).strip().lower().replace(" ", "_") for col in df.columns]
+        category = sheet_name.strip()
         
-        for _, row in df.iterrows():
-            faculty_id = str(row.get("faculty_id", "")).strip()
+        # Convert each column once instead of building a Series per row with iterrows()
+        columns = zip(
+            _text_column(df, "faculty_id"),
+            _text_column(df, "name"),
+            _text_column(df, "designation"),
+            _text_column(df, "department"),
+        )
+        for faculty_id, name, designation, department in columns:
             if not faculty_id:
                 continue
 
             all_data[faculty_id] = {
-                "name": str(row.get("name", "")).strip(),
-                "designation": str(row.get("designation", "")).strip(),
-                "department": str(row.get("department", "")).strip(),
-                "category": sheet_name.strip()
+                "name": name,
+                "designation": designation,
+                "department": department,
+                "category": category
             }
     
     return all_data
 
 def save_json(data, output_path):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    # Serialize first, then write the whole document in one buffered call
+    payload = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(payload)
     print(f"✅ JSON file saved at: {output_path}")
 
 if __name__ == "__main__":
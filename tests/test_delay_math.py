@@ -0,0 +1,163 @@
+"""Regression check for the daily delay math.
+
+checkin_checkout_bounds() compares plain ISO strings instead of parsing every
+timestamp, and _round_seconds/_ceil_seconds replace float rounding; both must
+give exactly what the original min/max-over-parse_ts logic gave. Run with
+`python -m unittest discover -s tests` from the repository root.
+"""
+import math
+import random
+import sys
+import unittest
+from datetime import datetime, time as dt_time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app  # noqa: E402
+
+
+# ---- Reference: the delay computation as it was before the fast paths ----
+
+def _reference_parse_ts(value):
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%SZ",
+                "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+def _reference_thresholds(date_obj, staff_type):
+    is_saturday = date_obj.weekday() == 5
+    if staff_type == 'teaching':
+        return dt_time(9, 25), dt_time(13, 0) if is_saturday else dt_time(16, 30)
+    if staff_type == 'admin':
+        return dt_time(9, 15), dt_time(13, 30) if is_saturday else dt_time(17, 15)
+    return dt_time(8, 30), dt_time(13, 30) if is_saturday else dt_time(17, 15)
+
+def _reference_delay_seconds(records, date_obj, staff_type):
+    checkins = [dt for dt in (_reference_parse_ts(r.get('checkin')) for r in records) if dt]
+    checkouts = [dt for dt in (_reference_parse_ts(r.get('checkout')) for r in records) if dt]
+    if not checkins:
+        return 0
+    earliest_in = min(checkins)
+    checkin_deadline, checkout_after = _reference_thresholds(date_obj, staff_type)
+    late_seconds = 0
+    deadline_dt = datetime.combine(earliest_in.date(), checkin_deadline)
+    if earliest_in > deadline_dt:
+        late_seconds = round((earliest_in - deadline_dt).total_seconds())
+    if not checkouts:
+        return late_seconds
+    latest_out = max(checkouts)
+    required_dt = datetime.combine(latest_out.date(), checkout_after)
+    early_leave_seconds = 0
+    if latest_out < required_dt:
+        early_leave_seconds = int(math.ceil((required_dt - latest_out).total_seconds()))
+    return late_seconds + early_leave_seconds
+
+
+WEEKDAY = datetime(2025, 10, 23)   # Thursday
+SATURDAY = datetime(2025, 10, 25)
+
+# Day sets that exercise each shortcut: separators, fractions, zones, foreign formats
+CASES = {
+    'mixed separators': [
+        {'checkin': '2025-10-23 09:30:00', 'checkout': '2025-10-23T16:00:00'},
+        {'checkin': '2025-10-23T09:26:00', 'checkout': '2025-10-23 16:10:00'},
+    ],
+    'fractional seconds': [
+        {'checkin': '2025-10-23T09:26:00.250', 'checkout': '2025-10-23T16:00:00.999999'},
+        {'checkin': '2025-10-23T09:26:00', 'checkout': '2025-10-23T16:00:00.5'},
+    ],
+    'z suffix': [
+        {'checkin': '2025-10-23T09:30:00Z', 'checkout': '2025-10-23T16:00:00.250000Z'},
+        {'checkin': '2025-10-23T09:40:00', 'checkout': '2025-10-23T15:00:00'},
+    ],
+    'dd-mm-yyyy ignored': [
+        {'checkin': '23-10-2025 08:00:00', 'checkout': '23-10-2025 18:00:00'},
+        {'checkin': '2025-10-23T09:31:13', 'checkout': '2025-10-23T16:20:00'},
+    ],
+    'only dd-mm-yyyy': [
+        {'checkin': '17-09-2025 11:31:13', 'checkout': '17-09-2025 17:00:00'},
+    ],
+    'checkin only': [
+        {'checkin': '2025-10-23T09:45:00', 'checkout': ''},
+    ],
+    'no checkin': [
+        {'checkin': '', 'checkout': '2025-10-23T16:00:00'},
+    ],
+    'not a real date': [
+        {'checkin': '2025-02-30T09:30:00', 'checkout': '2025-10-23T16:00:00'},
+        {'checkin': '2025-10-23T09:40:00', 'checkout': ''},
+    ],
+}
+
+# Late/early offsets around the half-second rounding boundary (round half to even, ceil)
+BOUNDARY_CHECKINS = ['2025-10-23T09:25:00.5', '2025-10-23T09:25:01.5', '2025-10-23T09:25:02.5',
+                     '2025-10-23T09:25:00.499999', '2025-10-23T09:25:00.500001']
+BOUNDARY_CHECKOUTS = ['2025-10-23T16:29:59.5', '2025-10-23T16:29:59.000001', '2025-10-23T16:29:59',
+                      '2025-10-23T16:30:00']
+
+
+def _random_value(rng, day):
+    t = f"{rng.randint(7, 18):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+    frac = rng.choice(['', '.5', '.250', f".{rng.randint(0, 999999):06d}"])
+    return rng.choice([
+        '',
+        f"{day}T{t}",
+        f"{day} {t}",
+        f"{day}T{t}{frac}",
+        f"{day}T{t}{frac or '.0'}Z",
+        f"{day}T{t}Z",
+        f"{day[8:]}-{day[5:7]}-{day[:4]} {t}",
+    ])
+
+
+class DelayMathTest(unittest.TestCase):
+
+    def assert_matches_reference(self, records, date_obj):
+        for staff_type in app.STAFF_TYPES:
+            with self.subTest(records=records, date=date_obj.date(), staff_type=staff_type):
+                self.assertEqual(app.compute_daily_delay_seconds(records, date_obj, staff_type),
+                                 _reference_delay_seconds(records, date_obj, staff_type))
+
+    def test_bounds_match_min_max_over_parse_ts(self):
+        for name, records in CASES.items():
+            with self.subTest(case=name):
+                checkins = [dt for dt in (_reference_parse_ts(r.get('checkin')) for r in records) if dt]
+                checkouts = [dt for dt in (_reference_parse_ts(r.get('checkout')) for r in records) if dt]
+                self.assertEqual(app.checkin_checkout_bounds(records),
+                                 (min(checkins) if checkins else None, max(checkouts) if checkouts else None))
+
+    def test_known_cases(self):
+        for records in CASES.values():
+            self.assert_matches_reference(records, WEEKDAY)
+
+    def test_half_second_boundaries(self):
+        for checkin in BOUNDARY_CHECKINS:
+            for checkout in BOUNDARY_CHECKOUTS:
+                self.assert_matches_reference([{'checkin': checkin, 'checkout': checkout}], WEEKDAY)
+
+    def test_random_days(self):
+        rng = random.Random(2025)
+        for date_obj in (WEEKDAY, SATURDAY):
+            day = date_obj.strftime('%Y-%m-%d')
+            for _ in range(300):
+                records = [{'checkin': _random_value(rng, day), 'checkout': _random_value(rng, day)}
+                           for _ in range(rng.randint(1, 4))]
+                self.assert_matches_reference(records, date_obj)
+
+    def test_ts_to_hhmmss_only_slices_iso(self):
+        self.assertEqual(app._ts_to_hhmmss('2025-10-23 09:30:00'), '09:30:00')
+        self.assertEqual(app._ts_to_hhmmss('2025-10-23T09:30:00.5Z'), '09:30:00')
+        self.assertEqual(app._ts_to_hhmmss('17-09-2025 11:31:13'), 'Not recorded')
+
+
+if __name__ == '__main__':
+    unittest.main()